@@ -27,8 +27,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 from pathlib import Path
+from collections import defaultdict
+import functools
 import json
 
+try:
+    import numpy as np  # 선택 의존성: 있으면 좌표 계산이 벡터화됨
+except ImportError:
+    np = None
+
 # 이미지 추출 모듈 (선택적)
 try:
     from image_extractor import (
@@ -921,6 +928,84 @@ def extract_document_elements(doc) -> ExtractedDocument:
 # 시각화 함수
 # =============================================================================
 
+def _layout_kernel(bx, by, bw, bh, tregions, min_y, y_scale, margin_top, scale, img_width, max_content_y):
+    """요소별 픽셀 좌표 변환 + 테이블 포함 판정 커널
+
+    numba가 설치되어 있으면 아래에서 @njit으로 컴파일됨.
+    """
+    n = bx.shape[0]
+    x1 = np.empty(n, np.int64)
+    y1 = np.empty(n, np.int64)
+    x2 = np.empty(n, np.int64)
+    y2 = np.empty(n, np.int64)
+    inside = np.zeros(n, np.bool_)
+    for i in range(n):
+        for j in range(tregions.shape[0]):
+            if (bx[i] >= tregions[j, 0] - 1 and bx[i] + bw[i] <= tregions[j, 2] + 1 and
+                    by[i] >= tregions[j, 1] - 1 and by[i] + bh[i] <= tregions[j, 3] + 1):
+                inside[i] = True
+                break
+        scaled_y = (by[i] - min_y) * y_scale + margin_top
+        scaled_height = bh[i] * y_scale
+        x1[i] = max(0, int(bx[i] * scale))
+        y1[i] = max(0, int(scaled_y * scale))
+        x2[i] = min(img_width - 1, int((bx[i] + bw[i]) * scale))
+        y2[i] = min(max_content_y - 5, int((scaled_y + scaled_height) * scale))
+    return x1, y1, x2, y2, inside
+
+
+try:
+    from numba import njit
+
+    _layout_kernel = njit(cache=True)(_layout_kernel)
+except ImportError:
+    pass
+
+
+def _load_font(font_size: int):
+    """시각화용 폰트 로드 (시스템별 후보 경로 순회)"""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", font_size)
+    except:
+        try:
+            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
+        except:
+            return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=8)
+def _build_legend(font_size: int, colors_tuple: tuple):
+    """범례 타일을 한 번만 렌더링해 캐시 (페이지마다 paste 한 번으로 대체)"""
+    from PIL import Image, ImageDraw
+
+    font = _load_font(font_size)
+    tile = Image.new("RGB", (200, 80), "white")
+    draw = ImageDraw.Draw(tile)
+    draw.text((0, 0), "범례:", fill="black", font=font)
+    y = 15
+    for elem_type, outline, fill, abbr in colors_tuple:
+        draw.rectangle([(0, y), (15, y + 12)], fill=fill, outline=outline)
+        draw.text((20, y), f"{abbr} - {elem_type}", fill="black", font=font)
+        y += 15
+    return tile
+
+
+def _hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """'#RRGGBB' 형식 색상을 (r, g, b) 튜플로 변환"""
+    color = color.lstrip("#")
+    return (int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16))
+
+
+def _paint_rect(arr, x1: int, y1: int, x2: int, y2: int, rgb, width: int = 1) -> None:
+    """numpy 배열에 사각형 테두리를 슬라이스 대입으로 그림 (픽셀 단위 C 레벨 연산)"""
+    arr[y1:y1 + width, x1:x2 + 1] = rgb
+    arr[max(y1, y2 - width + 1):y2 + 1, x1:x2 + 1] = rgb
+    arr[y1:y2 + 1, x1:x1 + width] = rgb
+    arr[y1:y2 + 1, max(x1, x2 - width + 1):x2 + 1] = rgb
+
+
 def visualize_elements(
     extracted: ExtractedDocument,
     output_path: str | Path,
@@ -930,6 +1015,8 @@ def visualize_elements(
     show_type_colors: bool = True,
     scale: float = 3.0,
     font_size: int = 10,
+    elements_on_page: list[DocumentElement] | None = None,
+    encoder: Literal["pil", "vips"] = "pil",
 ) -> Path:
     """
     추출된 문서 요소를 시각화합니다.
@@ -943,7 +1030,9 @@ def visualize_elements(
         show_type_colors: 요소 유형별 색상 구분
         scale: 확대 비율 (1mm = scale 픽셀)
         font_size: 폰트 크기
-    
+        elements_on_page: 해당 페이지 요소를 미리 분류한 리스트 (없으면 내부에서 필터링)
+        encoder: PNG 인코더 선택 ("pil" 기본, "vips"는 pyvips 필요)
+
     Returns:
         Path: 저장된 이미지 경로
     """
@@ -956,10 +1045,23 @@ def visualize_elements(
         raise ValueError(f"페이지 {page_num}이 존재하지 않습니다.")
     
     page = extracted.pages[page_num]
-    page_elements = [e for e in extracted.elements if e.page == page_num]
+    # 호출자가 페이지별로 미리 분류한 리스트를 주면 전체 스캔을 생략
+    if elements_on_page is not None:
+        page_elements = elements_on_page
+    else:
+        page_elements = [e for e in extracted.elements if e.page == page_num]
     
     # 요소들의 실제 범위 계산 (자동 스케일링용)
-    if page_elements:
+    if page_elements and np is not None:
+        # 한 번의 순회로 (y, y+height) 쌍을 모아 min/max를 C 레벨에서 계산
+        ys = np.fromiter(
+            ((e.bbox.y, e.bbox.y + e.bbox.height) for e in page_elements),
+            dtype=np.dtype((np.float64, 2)),
+            count=len(page_elements),
+        )
+        min_y = float(ys[:, 0].min())
+        max_y = float(ys[:, 1].max())
+    elif page_elements:
         max_y = max(e.bbox.y + e.bbox.height for e in page_elements)
         min_y = min(e.bbox.y for e in page_elements)
     else:
@@ -981,19 +1083,9 @@ def visualize_elements(
     # 이미지 크기
     img_width = int(page.width * scale)
     img_height = int(page.height * scale)
-    
-    # 이미지 생성
-    img = Image.new('RGB', (img_width, img_height), 'white')
-    draw = ImageDraw.Draw(img)
-    
+
     # 폰트
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+    font = _load_font(font_size)
     
     # 색상 및 약어 정의
     colors = {
@@ -1004,16 +1096,6 @@ def visualize_elements(
         "text": {"outline": "#9C27B0", "fill": "#F3E5F5", "abbr": "x"},  # 보라
     }
     
-    # 페이지 테두리
-    draw.rectangle([(0, 0), (img_width - 1, img_height - 1)], outline='black', width=2)
-    
-    # 여백 영역 (본문 영역)
-    content_top = int(page.margin_top * scale)
-    content_bottom = int((page.height - page.margin_bottom) * scale)
-    content_left = int(page.margin_left * scale)
-    content_right = int((page.width - page.margin_right) * scale)
-    draw.rectangle([(content_left, content_top), (content_right, content_bottom)], outline='lightgray', width=1)
-    
     # 테이블 영역 및 셀 텍스트 수집 (중복 paragraph 제거용)
     table_regions = []
     table_cell_texts = set()  # 테이블 셀 텍스트 모음
@@ -1040,15 +1122,28 @@ def visualize_elements(
                 return True
         return False
     
-    def is_duplicate_cell_text(text):
-        """텍스트가 테이블 셀 내용과 중복인지 확인"""
-        text_stripped = text.strip()
+    # 부분 매칭 대상은 4자 이상 셀 텍스트로 한정 (짧은 텍스트 제외 조건을 미리 적용)
+    # 길이별 버킷으로 색인해 비교 방향(포함/피포함)을 길이로 미리 판정
+    cells_by_len: dict[int, list[str]] = defaultdict(list)
+    for c in table_cell_texts:
+        if len(c) > 3:
+            cells_by_len[len(c)].append(c)
+
+    def is_duplicate_cell_text(text_stripped):
+        """텍스트(공백 제거됨)가 테이블 셀 내용과 중복인지 확인"""
         if text_stripped in table_cell_texts:
             return True
+        text_len = len(text_stripped)
+        if text_len <= 3:
+            return False
         # 부분 매칭 (텍스트가 셀 텍스트를 포함하거나 그 반대)
-        for cell_text in table_cell_texts:
-            if cell_text in text_stripped or text_stripped in cell_text:
-                if len(text_stripped) > 3 and len(cell_text) > 3:  # 짧은 텍스트 제외
+        # 더 긴 셀만 텍스트를 포함할 수 있고, 더 짧은 셀만 텍스트에 포함될 수 있음
+        for length, cells in cells_by_len.items():
+            if length > text_len:
+                if any(text_stripped in cell_text for cell_text in cells):
+                    return True
+            elif length < text_len:
+                if any(cell_text in text_stripped for cell_text in cells):
                     return True
         return False
     
@@ -1060,78 +1155,193 @@ def visualize_elements(
     min_scale_factor = 0.3  # 최소 30%까지만 축소
     y_scale_factor = max(y_scale_factor, min_scale_factor)
     
-    # 요소들 그리기 (Y 스케일링 적용, 중복 제거)
-    for elem in page_elements:
+    # 요소별 좌표 변환 + 테이블 포함 판정을 커널에서 일괄 계산
+    elem_coords = None
+    if np is not None and page_elements:
+        count = len(page_elements)
+        bx = np.fromiter((e.bbox.x for e in page_elements), np.float64, count)
+        by_arr = np.fromiter((e.bbox.y for e in page_elements), np.float64, count)
+        bw = np.fromiter((e.bbox.width for e in page_elements), np.float64, count)
+        bh = np.fromiter((e.bbox.height for e in page_elements), np.float64, count)
+        tregions = np.array(
+            [[t["x1"], t["y1"], t["x2"], t["y2"]] for t in table_regions], dtype=np.float64
+        ).reshape(len(table_regions), 4)
+        elem_coords = _layout_kernel(
+            bx, by_arr, bw, bh, tregions,
+            min_y, y_scale_factor, page.margin_top, scale, img_width, max_content_y,
+        )
+
+    # 1차 패스: 그릴 사각형/텍스트 좌표를 계산만 함 (그리기 백엔드와 분리)
+    rect_specs: list[tuple[int, int, int, int, str]] = []
+    text_specs: list[tuple[int, int, str]] = []
+    for idx, elem in enumerate(page_elements):
+        # 공백 제거 결과는 요소당 한 번만 계산해 재사용
+        stripped = elem.text.strip()
+
         # 테이블 내부의 paragraph 또는 셀 텍스트와 중복된 paragraph는 스킵
         if elem.element_type == "paragraph":
-            if is_inside_table(elem.bbox):
+            inside = (
+                bool(elem_coords[4][idx]) if elem_coords is not None
+                else is_inside_table(elem.bbox)
+            )
+            if inside:
                 continue
-            if is_duplicate_cell_text(elem.text):
+            if is_duplicate_cell_text(stripped):
                 continue
-        
+
         # 테이블 셀은 표시하지 않음 (테이블만 표시하여 깔끔하게)
         if elem.element_type == "table_cell":
             continue
-        
+
         color = colors.get(elem.element_type, colors["text"])
-        
-        # Y 좌표 스케일링 적용
-        scaled_y = (elem.bbox.y - min_y) * y_scale_factor + page.margin_top
-        scaled_height = elem.bbox.height * y_scale_factor
-        
-        # 좌표 변환
-        x1 = max(0, int(elem.bbox.x * scale))
-        y1 = max(0, int(scaled_y * scale))
-        x2 = min(img_width - 1, int((elem.bbox.x + elem.bbox.width) * scale))
-        y2 = min(max_content_y - 5, int((scaled_y + scaled_height) * scale))
-        
+
+        if elem_coords is not None:
+            x1 = int(elem_coords[0][idx])
+            y1 = int(elem_coords[1][idx])
+            x2 = int(elem_coords[2][idx])
+            y2 = int(elem_coords[3][idx])
+        else:
+            # Y 좌표 스케일링 적용
+            scaled_y = (elem.bbox.y - min_y) * y_scale_factor + page.margin_top
+            scaled_height = elem.bbox.height * y_scale_factor
+
+            # 좌표 변환
+            x1 = max(0, int(elem.bbox.x * scale))
+            y1 = max(0, int(scaled_y * scale))
+            x2 = min(img_width - 1, int((elem.bbox.x + elem.bbox.width) * scale))
+            y2 = min(max_content_y - 5, int((scaled_y + scaled_height) * scale))
+
         # 너무 작거나 범위 밖이면 스킵
         if x2 <= x1 or y2 <= y1:
             continue
-        
+
         if show_bbox:
-            if show_type_colors:
-                draw.rectangle([(x1, y1), (x2, y2)], outline=color["outline"], width=1)
-            else:
-                draw.rectangle([(x1, y1), (x2, y2)], outline='blue', width=1)
-        
-        if show_text and elem.text.strip():
-            display_text = elem.text.strip()
+            outline = color["outline"] if show_type_colors else "#0000FF"
+            rect_specs.append((x1, y1, x2, y2, outline))
+
+        if show_text and stripped:
+            display_text = stripped
             # 박스 너비에 맞게 텍스트 길이 제한
             box_width = x2 - x1
             max_chars = max(5, int(box_width / 6))  # 대략 글자당 6px
             if len(display_text) > max_chars:
                 display_text = display_text[:max_chars - 3] + "..."
-            
-            try:
-                # 요소 유형 약어 표시 (h:, p:, t:, c: 등)
-                abbr = color.get("abbr", "?")
-                draw.text((x1 + 2, y1 + 2), f"{abbr}:{display_text}", fill='black', font=font)
-            except:
-                pass
-    
+
+            # 요소 유형 약어 표시 (h:, p:, t:, c: 등)
+            abbr = color.get("abbr", "?")
+            text_specs.append((x1 + 2, y1 + 2, f"{abbr}:{display_text}"))
+
+    # 본문 영역 좌표
+    content_top = int(page.margin_top * scale)
+    content_bottom = int((page.height - page.margin_bottom) * scale)
+    content_left = int(page.margin_left * scale)
+    content_right = int((page.width - page.margin_right) * scale)
+
+    # 2차 패스: 사각형 테두리 그리기
+    # numpy가 있으면 팔레트(P) 모드 배열에 슬라이스 대입으로 일괄 처리
+    # — 픽셀당 1바이트라 RGB 대비 메모리와 PNG 인코딩 입력이 3분의 1
+    if np is not None:
+        palette_colors = ["#FFFFFF", "#000000", "#D3D3D3", "#0000FF"]
+        for color_info in colors.values():
+            palette_colors.append(color_info["outline"])
+            palette_colors.append(color_info["fill"])
+        color_idx = {c: i for i, c in enumerate(palette_colors)}
+
+        arr = np.zeros((img_height, img_width), dtype=np.uint8)  # 0 = 흰색 배경
+        _paint_rect(arr, 0, 0, img_width - 1, img_height - 1, color_idx["#000000"], width=2)
+        _paint_rect(arr, content_left, content_top, content_right, content_bottom, color_idx["#D3D3D3"])
+        for x1, y1, x2, y2, outline in rect_specs:
+            _paint_rect(arr, x1, y1, x2, y2, color_idx[outline])
+        img = Image.fromarray(arr, mode="P")
+        palette_bytes = bytearray()
+        for c in palette_colors:
+            palette_bytes.extend(_hex_to_rgb(c))
+        img.putpalette(bytes(palette_bytes))
+        draw = ImageDraw.Draw(img)
+
+        def _ink(c: str):
+            """P 모드에서는 팔레트 인덱스로 색을 지정"""
+            return color_idx.get(c, 1)
+    else:
+        img = Image.new('RGB', (img_width, img_height), 'white')
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([(0, 0), (img_width - 1, img_height - 1)], outline='black', width=2)
+        draw.rectangle([(content_left, content_top), (content_right, content_bottom)], outline='lightgray', width=1)
+        for x1, y1, x2, y2, outline in rect_specs:
+            draw.rectangle([(x1, y1), (x2, y2)], outline=outline, width=1)
+
+        def _ink(c: str):
+            return c
+
+    black = _ink("#000000")
+
+    # 텍스트 그리기
+    for tx, ty, label in text_specs:
+        try:
+            draw.text((tx, ty), label, fill=black, font=font)
+        except:
+            pass
+
     # 제목
     title = f"{extracted.title} - Page {page_num + 1}/{len(extracted.pages)}"
-    draw.text((10, 5), title, fill='black', font=font)
-    
-    # 범례 (약어와 함께 표시)
-    legend_y = img_height - 80
-    draw.text((10, legend_y), "범례:", fill='black', font=font)
-    legend_y += 15
-    for elem_type, color_info in colors.items():
-        abbr = color_info.get("abbr", "?")
-        draw.rectangle([(10, legend_y), (25, legend_y + 12)], fill=color_info["fill"], outline=color_info["outline"])
-        draw.text((30, legend_y), f"{abbr} - {elem_type}", fill='black', font=font)
-        legend_y += 15
-    
-    # 저장
+    draw.text((10, 5), title, fill=black, font=font)
+
+    # 범례 (약어와 함께 표시) — 페이지마다 동일하므로 캐시된 타일을 paste
+    colors_tuple = tuple(
+        (elem_type, info["outline"], info["fill"], info.get("abbr", "?"))
+        for elem_type, info in colors.items()
+    )
+    legend_tile = _build_legend(font_size, colors_tuple)
+    if img.mode == "P":
+        # 팔레트 이미지에는 같은 팔레트로 양자화해서 붙임
+        legend_tile = legend_tile.quantize(palette=img)
+    img.paste(legend_tile, (10, img_height - 80))
+    
+    # 저장 (시각화는 미리보기용이므로 압축 레벨을 낮춰 저장 속도 우선)
     output_path = Path(output_path)
-    img.save(output_path)
+    if encoder == "vips":
+        import pyvips
+
+        # vips에는 팔레트 정보가 전달되지 않으므로 RGB로 펼친 뒤 넘김
+        # (팔레트 인덱스를 그대로 주면 흑백에 가까운 이미지가 저장됨)
+        rgb_img = img.convert("RGB") if img.mode == "P" else img
+        vips_img = pyvips.Image.new_from_memory(
+            rgb_img.tobytes(), rgb_img.width, rgb_img.height,
+            len(rgb_img.getbands()), "uchar"
+        )
+        vips_img.pngsave(str(output_path), compression=1)
+    else:
+        img.save(output_path, format="PNG", compress_level=1, optimize=False)
     print(f"✅ 시각화 저장: {output_path}")
     
     return output_path
 
 
+def _page_digest(page_elements: list[DocumentElement]) -> str:
+    """페이지 요소 내용 기반 해시 (변경 없는 페이지의 재렌더링 생략용)"""
+    try:
+        import xxhash
+
+        h = xxhash.xxh3_64()
+    except ImportError:
+        import hashlib
+
+        h = hashlib.blake2b(digest_size=8)
+    for e in page_elements:
+        h.update(
+            f"{e.element_type}|{e.bbox.x},{e.bbox.y},{e.bbox.width},{e.bbox.height}|{e.text}".encode()
+        )
+    return h.hexdigest()
+
+
+def _render_page(args: tuple) -> Path:
+    """페이지 렌더링 헬퍼 (프로세스 풀에서 사용하므로 모듈 레벨에 정의)"""
+    extracted, img_path, page_num, elements_on_page = args
+    return visualize_elements(
+        extracted, img_path, page_num=page_num, elements_on_page=elements_on_page
+    )
+
+
 def create_visualization_report(
     extracted: ExtractedDocument,
     output_dir: str | Path,
@@ -1151,37 +1361,63 @@ def create_visualization_report(
     
     saved_files = []
     
-    # 각 페이지 시각화
+    # 페이지별 요소 인덱스를 한 번만 구축 (O(페이지 × 전체 요소) 스캔 방지)
+    by_page: dict[int, list[DocumentElement]] = {}
+    for elem in extracted.elements:
+        by_page.setdefault(elem.page, []).append(elem)
+
+    # 각 페이지 시각화 (페이지별 렌더링은 독립적이므로 병렬 처리)
+    # 요소 해시가 이전 렌더링과 같으면 PNG 인코딩 자체를 생략
+    tasks = []
+    pending_hashes = []
     for page_num in range(len(extracted.pages)):
         img_path = output_dir / f"{extracted.title}_page_{page_num + 1:03d}.png"
-        visualize_elements(extracted, img_path, page_num=page_num)
-        saved_files.append(img_path)
+        page_elems = by_page.get(page_num, [])
+        digest = _page_digest(page_elems)
+        hash_path = img_path.with_suffix(".hash")
+        if img_path.exists() and hash_path.exists() and hash_path.read_text() == digest:
+            saved_files.append(img_path)
+            continue
+        tasks.append((extracted, img_path, page_num, page_elems))
+        pending_hashes.append((hash_path, digest))
+
+    if len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            saved_files.extend(executor.map(_render_page, tasks))
+    else:
+        saved_files.extend(_render_page(task) for task in tasks)
+
+    # 렌더링이 끝난 페이지의 해시 기록 (다음 호출에서 스킵 판단에 사용)
+    for hash_path, digest in pending_hashes:
+        hash_path.write_text(digest)
     
-    # JSON 저장
+    # JSON 저장 (직렬화는 한 번만 수행하고 인코딩된 바이트를 단일 쓰기로 저장)
     json_path = output_dir / f"{extracted.title}_extracted.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        f.write(extracted.to_json())
+    json_path.write_bytes(extracted.to_json().encode("utf-8"))
     saved_files.append(json_path)
     print(f"✅ JSON 저장: {json_path}")
-    
+
     # 구조화된 텍스트 저장
     txt_path = output_dir / f"{extracted.title}_structured.txt"
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(extracted.to_structured_text())
+    txt_path.write_bytes(extracted.to_structured_text().encode("utf-8"))
     saved_files.append(txt_path)
     print(f"✅ 구조화된 텍스트 저장: {txt_path}")
     
     # 표 요약 저장
     if extracted.tables:
         tables_path = output_dir / f"{extracted.title}_tables.md"
-        with open(tables_path, "w", encoding="utf-8") as f:
-            f.write(f"# {extracted.title} - 표 목록\n\n")
-            f.write(f"**총 {len(extracted.tables)}개 표** | **페이지 수: {len(extracted.pages)}**\n\n")
-            for i, table in enumerate(extracted.tables):
-                page_num = table.page + 1  # 1-indexed for display
-                f.write(f"## 표 {i + 1} (페이지 {page_num})\n\n")
-                f.write(table.to_markdown())
-                f.write("\n\n")
+        # 작은 f.write 반복 대신 메모리에서 조립 후 한 번에 기록
+        parts = [
+            f"# {extracted.title} - 표 목록\n\n",
+            f"**총 {len(extracted.tables)}개 표** | **페이지 수: {len(extracted.pages)}**\n\n",
+        ]
+        parts.extend(
+            f"## 표 {i + 1} (페이지 {table.page + 1})\n\n{table.to_markdown()}\n\n"
+            for i, table in enumerate(extracted.tables)
+        )
+        tables_path.write_text("".join(parts), encoding="utf-8")
         saved_files.append(tables_path)
         print(f"✅ 표 목록 저장: {tables_path}")
     
@@ -1218,24 +1454,33 @@ def create_visualization_report(
             "image_count": len(extracted.images),
             "images": [img.to_ocr_dict() for img in extracted.images],
         }
-        with open(images_json_path, "w", encoding="utf-8") as f:
-            json.dump(images_data, f, ensure_ascii=False, indent=2)
+        try:
+            # orjson이 있으면 대용량 이미지 메타데이터 직렬화가 수 배 빨라짐
+            import orjson
+
+            images_json_path.write_bytes(orjson.dumps(images_data, option=orjson.OPT_INDENT_2))
+        except ImportError:
+            images_json_path.write_text(
+                json.dumps(images_data, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
         saved_files.append(images_json_path)
         print(f"✅ 이미지 메타데이터 저장: {images_json_path}")
         
         images_md_path = output_dir / f"{extracted.title}_images.md"
-        with open(images_md_path, "w", encoding="utf-8") as f:
-            f.write(f"# {extracted.title} - 이미지 목록\n\n")
-            f.write(f"**총 {len(extracted.images)}개 이미지** | **페이지 수: {len(extracted.pages)}**\n\n")
-            f.write("| # | 파일명 | 형식 | 크기 | 해상도 | 위치 (mm) | 페이지 |\n")
-            f.write("|---|--------|------|------|--------|-----------|--------|\n")
-            for i, img in enumerate(extracted.images, 1):
-                size_str = f"{img.file_size:,} B"
-                res_str = f"{img.pixel_width}×{img.pixel_height}" if img.pixel_width else "-"
-                pos_str = f"({img.bbox.x:.1f}, {img.bbox.y:.1f})" if img.bbox.width > 0 else "-"
-                page_str = str(img.page + 1) if img.bbox.width > 0 else "-"
-                f.write(f"| {i} | {img.filename} | {img.format.upper()} | {size_str} | {res_str} | {pos_str} | {page_str} |\n")
-            f.write("\n")
+        md_parts = [
+            f"# {extracted.title} - 이미지 목록\n\n",
+            f"**총 {len(extracted.images)}개 이미지** | **페이지 수: {len(extracted.pages)}**\n\n",
+            "| # | 파일명 | 형식 | 크기 | 해상도 | 위치 (mm) | 페이지 |\n",
+            "|---|--------|------|------|--------|-----------|--------|\n",
+        ]
+        for i, img in enumerate(extracted.images, 1):
+            size_str = f"{img.file_size:,} B"
+            res_str = f"{img.pixel_width}×{img.pixel_height}" if img.pixel_width else "-"
+            pos_str = f"({img.bbox.x:.1f}, {img.bbox.y:.1f})" if img.bbox.width > 0 else "-"
+            page_str = str(img.page + 1) if img.bbox.width > 0 else "-"
+            md_parts.append(f"| {i} | {img.filename} | {img.format.upper()} | {size_str} | {res_str} | {pos_str} | {page_str} |\n")
+        md_parts.append("\n")
+        images_md_path.write_text("".join(md_parts), encoding="utf-8")
         saved_files.append(images_md_path)
         print(f"✅ 이미지 목록 저장: {images_md_path}")
     
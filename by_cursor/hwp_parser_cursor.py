@@ -43,11 +43,13 @@ HWP 파일 내부 구조:
 """
 
 from __future__ import annotations
+import mmap
 import struct
+import sys
 import zlib
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Iterator, BinaryIO, Any
+from typing import Iterator, BinaryIO, Any, NamedTuple
 import json
 
 # olefile은 선택적 의존성
@@ -57,6 +59,24 @@ try:
 except ImportError:
     HAS_OLEFILE = False
 
+# numpy도 선택적 의존성 (있으면 문단 텍스트 디코딩이 벡터화됨)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# PARA_TEXT의 UTF-16LE 코드는 리틀엔디언 호스트에서만 무복사 재해석 가능
+_NATIVE_LE = sys.byteorder == 'little'
+
+# Cython 등으로 빌드한 C 가속 모듈이 있으면 문단 디코딩 루프를 네이티브로 대체
+# (모듈이 없으면 아래의 순수 파이썬/numpy 구현을 그대로 사용)
+try:
+    import _hwp_fast
+    HAS_HWP_FAST = True
+except ImportError:
+    HAS_HWP_FAST = False
+
 
 # =============================================================================
 # 상수 정의
@@ -95,6 +115,25 @@ class HwpTagId:
     TABLE_CELL = 0x4E           # 표 셀
 
 
+# 반복 사용하는 struct 포맷은 모듈 레벨에서 한 번만 컴파일
+# (unpack_from은 슬라이스/튜플 중간 객체 없이 버퍼에서 바로 읽음)
+_U32 = struct.Struct('<I')
+_U16 = struct.Struct('<H')
+
+# 제어 코드(0~31)가 출력할 문자 (9=탭, 10/13/16=줄바꿈, 17=하이픈, 나머지는 없음)
+_CTRL_EMIT: tuple[str, ...] = tuple(
+    '\t' if c == 9 else
+    '\n' if c in (10, 13, 16) else
+    '-' if c == 17 else ''
+    for c in range(32)
+)
+
+# 제어 코드 뒤에 붙는 추가 데이터 크기 (UTF-16 워드 수, 8바이트 = 4워드)
+_CTRL_SKIP_WORDS: tuple[int, ...] = tuple(
+    4 if c in (2, 3, 11, 14, 15, 21, 23, 24, 30) else 0 for c in range(32)
+)
+
+
 # 파일 헤더 플래그
 class HwpHeaderFlag:
     """파일 헤더 속성 플래그"""
@@ -112,24 +151,26 @@ class HwpHeaderFlag:
 # 데이터 클래스 정의
 # =============================================================================
 
-@dataclass
-class HwpRecord:
+class HwpRecord(NamedTuple):
     """
     HWP 레코드 (데이터의 기본 단위)
-    
+
+    NamedTuple이므로 레코드당 __dict__ 할당이 없고,
+    data는 원본 버퍼에 대한 zero-copy memoryview입니다.
+
     Attributes:
         tag_id: 레코드 종류 (HwpTagId 참조)
         level: 레코드 깊이 (중첩 수준)
         size: 데이터 크기
-        data: 원시 데이터
+        data: 원시 데이터 (원본 버퍼의 memoryview)
     """
     tag_id: int
     level: int
     size: int
-    data: bytes
+    data: bytes | memoryview
 
 
-@dataclass
+@dataclass(slots=True)
 class CharShape:
     """글자 모양 정보"""
     font_id: int = 0            # 글꼴 ID
@@ -140,7 +181,7 @@ class CharShape:
     color: int = 0              # 글자 색상
 
 
-@dataclass
+@dataclass(slots=True)
 class ParaShape:
     """문단 모양 정보"""
     align: int = 0              # 정렬 (0=양쪽, 1=왼쪽, 2=오른쪽, 3=가운데)
@@ -150,7 +191,7 @@ class ParaShape:
     line_spacing: int = 160     # 줄 간격 (%)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """테이블 셀"""
     row: int
@@ -162,7 +203,7 @@ class TableCell:
     height: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """테이블 데이터"""
     rows: int
@@ -188,13 +229,23 @@ class Table:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """문단 데이터"""
     text: str = ""
     char_shapes: list[CharShape] = field(default_factory=list)
     para_shape: ParaShape = field(default_factory=ParaShape)
     tables: list[Table] = field(default_factory=list)
+    # PARA_TEXT 레코드별 텍스트 조각 (문단 종료 시 한 번에 join — += 반복 방지)
+    _parts: list[str] = field(default_factory=list, repr=False)
+    # 비공백 텍스트/표가 추가되는 순간 True — 종료 시 strip() 재검사 방지
+    _has_content: bool = field(default=False, repr=False)
+
+    def finalize_text(self) -> None:
+        """누적된 텍스트 조각을 text로 합침 (파싱 종료 시 호출)"""
+        if self._parts:
+            self.text = ''.join(self._parts) if not self.text else self.text + ''.join(self._parts)
+            self._parts = []
     
     @property
     def plain_text(self) -> str:
@@ -209,7 +260,7 @@ class Paragraph:
         return ''.join(result)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """섹션 데이터"""
     index: int
@@ -223,7 +274,7 @@ class Section:
         return "\n".join(p.plain_text for p in self.paragraphs if p.plain_text.strip())
 
 
-@dataclass
+@dataclass(slots=True)
 class FontInfo:
     """글꼴 정보"""
     id: int
@@ -231,7 +282,7 @@ class FontInfo:
     type: str = "TTF"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileHeader:
     """파일 헤더 정보"""
     signature: str = ""
@@ -241,7 +292,7 @@ class FileHeader:
     is_encrypted: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class HwpDocument:
     """
     HWP 문서 전체
@@ -373,6 +424,10 @@ class HwpParser:
         
         self.ole = None
         self.is_compressed = False
+        self._streams: set[str] | None = None
+        self._body_sections: list[str] = []
+        self._fd: BinaryIO | None = None
+        self._mm: mmap.mmap | None = None
     
     def parse(self) -> HwpDocument:
         """
@@ -384,8 +439,18 @@ class HwpParser:
         doc = HwpDocument(file_path=self.file_path)
         
         try:
-            self.ole = olefile.OleFileIO(str(self.file_path))
-            
+            # 파일 전체를 mmap으로 매핑해 스트림 읽기를 페이지 캐시에서 직접 처리
+            self._fd = open(self.file_path, 'rb')
+            self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+            self.ole = olefile.OleFileIO(self._mm)
+
+            # 스트림 경로를 한 번만 수집 (exists()의 디렉터리 재탐색 방지)
+            self._streams = {'/'.join(entry) for entry in self.ole.listdir()}
+            self._body_sections = sorted(
+                (name for name in self._streams if name.startswith('BodyText/Section')),
+                key=lambda name: int(name[16:]) if name[16:].isdigit() else 0,
+            )
+
             # 1. 파일 헤더 파싱
             doc.header = self._parse_file_header()
             self.is_compressed = doc.header.is_compressed
@@ -393,8 +458,17 @@ class HwpParser:
             # 2. 문서 정보 파싱 (글꼴 등)
             doc.fonts = self._parse_doc_info()
             
-            # 3. 본문 파싱
-            doc.sections = list(self._parse_body_text())
+            # 3. 본문 파싱 (섹션이 여러 개면 프로세스 풀에서 병렬 파싱)
+            if len(self._body_sections) > 1:
+                raws = [
+                    (i, self.ole.openstream(name).read(), self.is_compressed)
+                    for i, name in enumerate(self._body_sections)
+                ]
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor() as executor:
+                    doc.sections = list(executor.map(_parse_section_bytes, raws))
+            else:
+                doc.sections = list(self._parse_body_text())
             
             # 4. 미리보기 텍스트
             doc.preview_text = self._get_preview_text()
@@ -402,14 +476,20 @@ class HwpParser:
         finally:
             if self.ole:
                 self.ole.close()
-        
+            if self._mm:
+                self._mm.close()
+                self._mm = None
+            if self._fd:
+                self._fd.close()
+                self._fd = None
+
         return doc
     
     def _parse_file_header(self) -> FileHeader:
         """파일 헤더 파싱"""
         header = FileHeader()
         
-        if not self.ole.exists("FileHeader"):
+        if not self._stream_exists("FileHeader"):
             return header
         
         data = self.ole.openstream("FileHeader").read()
@@ -419,7 +499,7 @@ class HwpParser:
         
         # 버전 (4바이트, offset 32)
         if len(data) >= 36:
-            version = struct.unpack('<I', data[32:36])[0]
+            version = _U32.unpack_from(data, 32)[0]
             major = (version >> 24) & 0xFF
             minor = (version >> 16) & 0xFF
             build = (version >> 8) & 0xFF
@@ -428,7 +508,7 @@ class HwpParser:
         
         # 플래그 (4바이트, offset 36)
         if len(data) >= 40:
-            header.flags = struct.unpack('<I', data[36:40])[0]
+            header.flags = _U32.unpack_from(data, 36)[0]
             header.is_compressed = bool(header.flags & HwpHeaderFlag.COMPRESSED)
             header.is_encrypted = bool(header.flags & HwpHeaderFlag.ENCRYPTED)
         
@@ -438,69 +518,90 @@ class HwpParser:
         """문서 정보 파싱 (글꼴 정보 추출)"""
         fonts = []
         
-        if not self.ole.exists("DocInfo"):
+        if not self._stream_exists("DocInfo"):
             return fonts
         
         data = self._read_stream("DocInfo")
         if not data:
             return fonts
         
-        # 레코드 순회하며 글꼴 정보 추출
-        font_id = 0
-        for record in self._iter_records(data):
-            if record.tag_id == HwpTagId.FACE_NAME:
-                font_name = self._decode_text(record.data)
-                fonts.append(FontInfo(id=font_id, name=font_name))
-                font_id += 1
-        
+        # FACE_NAME만 골라내는 전용 스캐너 사용 — 무시할 레코드는
+        # HwpRecord/슬라이스 할당 없이 헤더만 읽고 건너뜀
+        for font_id, face_data in enumerate(self._scan_facenames(data)):
+            fonts.append(FontInfo(id=font_id, name=self._decode_text(face_data)))
+
         return fonts
-    
+
+    def _scan_facenames(self, data: bytes, _unpack=_U32.unpack_from) -> Iterator[memoryview]:
+        """DocInfo에서 FACE_NAME 레코드의 데이터만 내보내는 특화 스캐너"""
+        face_name = HwpTagId.FACE_NAME
+        offset = 0
+        L = len(data)
+        mv = memoryview(data)
+
+        while offset + 4 <= L:
+            header = _unpack(data, offset)[0]
+            tag_id = header & 0x3FF
+            size = (header >> 20) & 0xFFF
+            offset += 4
+            if size == 0xFFF:
+                if offset + 4 > L:
+                    break
+                size = _unpack(data, offset)[0]
+                offset += 4
+            if offset + size > L:
+                break
+            if tag_id == face_name:
+                yield mv[offset:offset + size]
+            offset += size
+
+
     def _parse_body_text(self) -> Iterator[Section]:
         """본문 텍스트 파싱"""
-        section_idx = 0
-        
-        while True:
-            stream_name = f"BodyText/Section{section_idx}"
-            if not self.ole.exists(stream_name):
-                break
-            
-            section = self._parse_section(stream_name, section_idx)
-            yield section
-            section_idx += 1
+        # Section0, Section1, ... 을 순차 탐색하는 대신 수집된 목록을 바로 순회
+        for section_idx, stream_name in enumerate(self._body_sections):
+            yield self._parse_section(stream_name, section_idx)
     
     def _parse_section(self, stream_name: str, index: int) -> Section:
         """단일 섹션 파싱"""
         section = Section(index=index)
-        
-        data = self._read_stream(stream_name)
-        if not data:
-            return section
-        
+
+        # 압축 해제 청크를 레코드 단위로 바로 소비 (전체 버퍼 미적재)
+        records = self._iter_records(self._stream_chunks(stream_name))
+        return self._parse_section_records(records, section)
+
+    def _parse_section_records(self, records: Iterator[HwpRecord], section: Section) -> Section:
+        """레코드 스트림에서 섹션 내용을 채움 (OLE 핸들 불필요)"""
         current_para = None
         current_table = None
         table_row = 0
         table_col = 0
-        
-        for record in self._iter_records(data):
+
+        for record in records:
             tag = record.tag_id
             
             # 문단 헤더
             if tag == HwpTagId.PARA_HEADER:
-                if current_para and (current_para.text.strip() or current_para.tables):
-                    section.paragraphs.append(current_para)
+                if current_para:
+                    current_para.finalize_text()
+                    if current_para._has_content or current_para.tables:
+                        section.paragraphs.append(current_para)
                 current_para = Paragraph()
-            
+
             # 문단 텍스트
             elif tag == HwpTagId.PARA_TEXT and current_para:
+                # 조각 리스트에 모았다가 문단 종료 시 한 번에 join
                 text = self._decode_para_text(record.data)
-                current_para.text += text
+                current_para._parts.append(text)
+                if not current_para._has_content and text and not text.isspace():
+                    current_para._has_content = True
             
             # 표 시작
             elif tag == HwpTagId.TABLE:
                 if len(record.data) >= 8:
-                    flags = struct.unpack('<I', record.data[:4])[0]
-                    rows = struct.unpack('<H', record.data[4:6])[0]
-                    cols = struct.unpack('<H', record.data[6:8])[0]
+                    flags = _U32.unpack_from(record.data, 0)[0]
+                    rows = _U16.unpack_from(record.data, 4)[0]
+                    cols = _U16.unpack_from(record.data, 6)[0]
                     current_table = Table(rows=rows, cols=cols)
                     table_row = 0
                     table_col = 0
@@ -513,38 +614,95 @@ class HwpParser:
             # 페이지 정의
             elif tag == HwpTagId.PAGE_DEF:
                 if len(record.data) >= 8:
-                    section.page_width = struct.unpack('<I', record.data[:4])[0]
-                    section.page_height = struct.unpack('<I', record.data[4:8])[0]
+                    section.page_width = _U32.unpack_from(record.data, 0)[0]
+                    section.page_height = _U32.unpack_from(record.data, 4)[0]
         
         # 마지막 문단 추가
-        if current_para and (current_para.text.strip() or current_para.tables):
-            section.paragraphs.append(current_para)
-        
+        if current_para:
+            current_para.finalize_text()
+            if current_para._has_content or current_para.tables:
+                section.paragraphs.append(current_para)
+
         return section
     
+    def _stream_exists(self, stream_name: str) -> bool:
+        """스트림 존재 여부 확인 (parse()에서 수집한 경로 집합을 우선 사용)"""
+        if self._streams is not None:
+            return stream_name in self._streams
+        return self.ole.exists(stream_name)
+
     def _read_stream(self, stream_name: str) -> bytes:
-        """스트림 읽기 (압축 해제 포함)"""
-        if not self.ole.exists(stream_name):
+        """스트림 읽기 (압축 해제 포함)
+
+        압축 스트림은 전체를 읽고 한 번에 풀지 않고 64KB 단위로
+        스트리밍 해제해 피크 메모리를 낮춥니다.
+        """
+        if not self._stream_exists(stream_name):
             return b''
-        
-        data = self.ole.openstream(stream_name).read()
-        
-        # 압축 해제
-        if self.is_compressed and data:
-            try:
-                data = zlib.decompress(data, -15)  # raw deflate
-            except zlib.error:
-                pass  # 압축되지 않은 데이터
-        
-        return data
+
+        stream = self.ole.openstream(stream_name)
+
+        if self.is_compressed:
+            # FileHeader의 압축 플래그를 신뢰 — 실패하면 손상 파일이므로 그대로 전파
+            decomp = zlib.decompressobj(-15)  # raw deflate
+            out = bytearray()
+            while True:
+                chunk = stream.read(64 * 1024)
+                if not chunk:
+                    break
+                out += decomp.decompress(chunk)
+            out += decomp.flush()
+            return bytes(out)
+
+        return stream.read()
     
-    def _iter_records(self, data: bytes) -> Iterator[HwpRecord]:
-        """레코드 순회"""
+    def _stream_chunks(self, stream_name: str) -> Iterator[bytes]:
+        """스트림을 64KB 청크로 읽으며 (필요시 압축 해제하여) 내보냄
+
+        _iter_records의 청크 입력과 결합하면 섹션 전체를 메모리에
+        올리지 않고 압축 해제와 레코드 파싱이 겹쳐 진행됩니다.
+        """
+        if not self._stream_exists(stream_name):
+            return
+        stream = self.ole.openstream(stream_name)
+        if self.is_compressed:
+            decomp = zlib.decompressobj(-15)  # raw deflate
+            while True:
+                chunk = stream.read(64 * 1024)
+                if not chunk:
+                    break
+                piece = decomp.decompress(chunk)
+                if piece:
+                    yield piece
+            tail = decomp.flush()
+            if tail:
+                yield tail
+        else:
+            while True:
+                chunk = stream.read(64 * 1024)
+                if not chunk:
+                    break
+                yield chunk
+
+    def _iter_records(self, data, _unpack=_U32.unpack_from) -> Iterator[HwpRecord]:
+        """레코드 순회
+
+        data는 bytes(전체 버퍼) 또는 bytes 청크 iterable을 받습니다.
+        청크 iterable이면 소비한 접두부를 버리는 롤링 버퍼로 동작해
+        피크 메모리가 O(최대 레코드 크기)로 제한됩니다.
+        (자주 쓰는 전역은 기본 인자로 지역 바인딩 — LOAD_FAST)
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            yield from self._iter_records_chunked(iter(data))
+            return
+
         offset = 0
-        
-        while offset < len(data) - 4:
+        L = len(data)  # 루프 내 len() 재평가 방지
+        mv = memoryview(data)  # 레코드 데이터는 복사 없이 뷰로 전달
+
+        while offset + 4 <= L:  # 마지막 레코드가 버퍼 끝에 딱 맞아도 처리
             # 4바이트 헤더 읽기
-            header = struct.unpack('<I', data[offset:offset+4])[0]
+            header = _unpack(data, offset)[0]
             
             tag_id = header & 0x3FF           # 하위 10비트
             level = (header >> 10) & 0x3FF    # 다음 10비트
@@ -554,121 +712,177 @@ class HwpParser:
             
             # 크기가 0xFFF이면 다음 4바이트가 실제 크기
             if size == 0xFFF:
-                if offset + 4 > len(data):
+                if offset + 4 > L:
                     break
-                size = struct.unpack('<I', data[offset:offset+4])[0]
+                size = _unpack(data, offset)[0]
                 offset += 4
-            
+
             # 데이터 읽기
-            if offset + size > len(data):
+            if offset + size > L:
                 break
             
-            record_data = data[offset:offset+size]
+            record_data = mv[offset:offset+size]
             offset += size
-            
+
             yield HwpRecord(tag_id=tag_id, level=level, size=size, data=record_data)
-    
+
+    def _iter_records_chunked(self, chunks: Iterator[bytes],
+                              _unpack=_U32.unpack_from) -> Iterator[HwpRecord]:
+        """청크 iterable에서 레코드를 순회 (롤링 버퍼)"""
+        buf = b''
+        pos = 0
+
+        def fill(needed: int) -> bool:
+            # 필요한 만큼 버퍼를 채우고, 소비한 접두부는 잘라냄
+            # (buf는 불변 bytes이므로 이미 내보낸 memoryview는 계속 유효)
+            nonlocal buf, pos
+            while len(buf) - pos < needed:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return False
+                buf = buf[pos:] + bytes(chunk)
+                pos = 0
+            return True
+
+        while fill(4):
+            header = _unpack(buf, pos)[0]
+            tag_id = header & 0x3FF           # 하위 10비트
+            level = (header >> 10) & 0x3FF    # 다음 10비트
+            size = (header >> 20) & 0xFFF     # 상위 12비트
+            pos += 4
+
+            # 크기가 0xFFF이면 다음 4바이트가 실제 크기
+            if size == 0xFFF:
+                if not fill(4):
+                    break
+                size = _unpack(buf, pos)[0]
+                pos += 4
+
+            if not fill(size):
+                break
+
+            record_data = memoryview(buf)[pos:pos + size]
+            pos += size
+            yield HwpRecord(tag_id=tag_id, level=level, size=size, data=record_data)
+
     def _decode_para_text(self, data: bytes) -> str:
-        """문단 텍스트 디코딩"""
+        """문단 텍스트 디코딩
+
+        numpy가 있으면 전체 버퍼를 uint16 배열로 한 번에 해석해
+        제어 코드 위치만 찾고, 일반 문자 구간은 C 레벨 UTF-16 디코더로
+        통째로 변환합니다. 제어 코드는 희소하므로 파이썬 루프는
+        O(제어 코드 수)로 줄어듭니다.
+        """
         if not data:
             return ""
-        
+
+        # C 확장이 설치돼 있으면 네이티브 디코더 사용
+        if HAS_HWP_FAST:
+            return _hwp_fast.decode_para_text(bytes(data))
+
+        # 짧은 문단은 numpy 준비 비용이 더 크므로 스칼라 경로 사용
+        # (빅엔디언 호스트에서는 uint16 재해석이 바이트 스왑을 요구하므로 제외)
+        if not HAS_NUMPY or not _NATIVE_LE or len(data) < 64:
+            return self._decode_para_text_scalar(data)
+
+        codes = np.frombuffer(data, dtype=np.uint16, count=len(data) // 2)
+        ctrl_idx = np.flatnonzero(codes < 32)
+        result = []
+        pos = 0  # 워드(2바이트) 단위 위치
+        word_count = codes.shape[0]
+        for ci in ctrl_idx:
+            if ci < pos:
+                continue  # 제어 코드의 추가 데이터 구간 내부는 건너뜀
+            if ci > pos:
+                # 일반 문자 구간을 한 번에 디코딩 (memoryview면 구간만 복사)
+                result.append(bytes(data[pos * 2:ci * 2]).decode('utf-16-le', errors='ignore'))
+            code = int(codes[ci])
+            if code == 13:  # 문단 끝 — 압도적으로 빈번하므로 최우선 처리
+                result.append('\n')
+                pos = ci + 1
+                continue
+            if code == 0:  # 문자열 끝
+                return ''.join(result)
+            result.append(_CTRL_EMIT[code])
+            pos = ci + 1 + _CTRL_SKIP_WORDS[code]
+        if pos < word_count:
+            result.append(bytes(data[pos * 2:word_count * 2]).decode('utf-16-le', errors='ignore'))
+        return ''.join(result)
+
+    def _decode_para_text_scalar(self, data: bytes, _bytes=bytes,
+                                 _CTRL_EMIT=_CTRL_EMIT,
+                                 _CTRL_SKIP_WORDS=_CTRL_SKIP_WORDS) -> str:
+        """문단 텍스트 디코딩 (numpy 없는 환경용 스칼라 경로)"""
         result = []
         i = 0
-        
-        while i < len(data) - 1:
-            # UTF-16LE로 2바이트씩 읽기
-            char_code = struct.unpack('<H', data[i:i+2])[0]
+        length = len(data)
+
+        while i < length - 1:
+            # 제어 코드(상위 바이트 0, 하위 바이트 < 32)가 나올 때까지 일반 문자 구간 스캔
+            run_start = i
+            while i < length - 1 and (data[i + 1] != 0 or data[i] >= 32):
+                i += 2
+            if i > run_start:
+                # 일반 문자 구간은 문자 단위 chr() 대신 한 번에 디코딩
+                result.append(_bytes(data[run_start:i]).decode('utf-16-le', errors='ignore'))
+            if i >= length - 1:
+                break
+
+            # HWP 특수 문자 처리: 분기 사슬 대신 사전 계산된 테이블 조회
+            # (가장 빈번한 문단 끝(13)은 테이블 조회 없이 바로 처리)
+            char_code = data[i]
             i += 2
-            
-            # HWP 특수 문자 처리
-            if char_code < 32:
-                if char_code == 0:  # 문자열 끝
-                    break
-                elif char_code == 1:  # 예약
-                    pass
-                elif char_code == 2:  # 섹션/단 정의
-                    i += 8  # 추가 데이터 스킵
-                elif char_code == 3:  # 필드 시작
-                    i += 8
-                elif char_code == 4:  # 필드 끝
-                    pass
-                elif char_code == 9:  # 탭
-                    result.append('\t')
-                elif char_code == 10:  # 줄바꿈
-                    result.append('\n')
-                elif char_code == 11:  # 그리기 객체/표
-                    i += 8
-                elif char_code == 12:  # 예약
-                    pass
-                elif char_code == 13:  # 문단 끝
-                    result.append('\n')
-                elif char_code == 14:  # 머리말/꼬리말/각주/미주
-                    i += 8
-                elif char_code == 15:  # 숨은 설명
-                    i += 8
-                elif char_code == 16:  # 강제 줄나눔
-                    result.append('\n')
-                elif char_code == 17:  # 하이픈
-                    result.append('-')
-                elif char_code == 18:  # 예약
-                    pass
-                elif char_code == 19:  # 예약
-                    pass
-                elif char_code == 20:  # 예약
-                    pass
-                elif char_code == 21:  # 컨트롤 객체
-                    i += 8
-                elif char_code == 22:  # 예약
-                    pass
-                elif char_code == 23:  # 책갈피/양식
-                    i += 8
-                elif char_code == 24:  # 덧말
-                    i += 8
-                elif char_code == 25:  # 예약
-                    pass
-                elif char_code == 26:  # 예약
-                    pass
-                elif char_code == 27:  # 예약
-                    pass
-                elif char_code == 28:  # 예약
-                    pass
-                elif char_code == 29:  # 예약
-                    pass
-                elif char_code == 30:  # 글자 겹침
-                    i += 8
-                elif char_code == 31:  # 예약
-                    pass
-            else:
-                # 일반 문자
-                result.append(chr(char_code))
-        
+            if char_code == 13:  # 문단 끝
+                result.append('\n')
+                continue
+            if char_code == 0:  # 문자열 끝
+                break
+            result.append(_CTRL_EMIT[char_code])
+            i += _CTRL_SKIP_WORDS[char_code] * 2  # 추가 데이터 스킵
+
         return ''.join(result)
     
     def _decode_text(self, data: bytes) -> str:
-        """일반 텍스트 디코딩 (UTF-16LE)"""
+        """일반 텍스트 디코딩 (UTF-16LE)
+
+        글꼴 이름(FACE_NAME) 레코드는 1바이트 속성 + 2바이트 길이(워드 수)
+        + UTF-16LE 이름 구조이므로 길이를 직접 읽어 정확한 구간만 디코딩합니다.
+        find(b'\\x00\\x00')는 전체를 스캔하는 데다 워드 경계를 넘어
+        잘못 매칭될 수 있습니다.
+        """
+        if not isinstance(data, bytes):
+            data = bytes(data)  # memoryview로 전달될 수 있음 (FACE_NAME은 드문 레코드)
+        if len(data) < 3:
+            return ""
         try:
-            # 속성 바이트를 건너뛰고 텍스트 추출
-            # 글꼴 이름은 첫 바이트가 속성
-            if data and len(data) > 1:
-                text_data = data[1:]  # 첫 바이트 스킵
-                # 널 문자까지만 읽기
-                null_pos = text_data.find(b'\x00\x00')
-                if null_pos >= 0:
-                    text_data = text_data[:null_pos+1]
-                return text_data.decode('utf-16le', errors='ignore').rstrip('\x00')
+            word_count = _U16.unpack_from(data, 1)[0]
+            end = 3 + 2 * word_count
+            if end <= len(data):
+                return data[3:end].decode('utf-16le', errors='ignore').rstrip('\x00')
+
+            # 길이 필드를 신뢰할 수 없는 경우: 워드 경계에서만 널 종료 탐색
+            text_data = data[1:]
+            for j in range(0, len(text_data) - 1, 2):
+                if text_data[j] == 0 and text_data[j + 1] == 0:
+                    text_data = text_data[:j]
+                    break
+            return text_data.decode('utf-16le', errors='ignore').rstrip('\x00')
         except:
             pass
         return ""
     
     def _get_preview_text(self) -> str:
         """미리보기 텍스트 읽기"""
-        if not self.ole.exists("PrvText"):
+        if not self._stream_exists("PrvText"):
             return ""
         
         try:
-            data = self.ole.openstream("PrvText").read()
-            return data.decode('utf-16le', errors='ignore').rstrip('\x00')
+            raw = self.ole.openstream("PrvText").read()
+            # 후행 UTF-16 널 쌍을 바이트 수준에서 제거 후 필요한 만큼만 디코드
+            end = len(raw) & ~1
+            while end >= 2 and raw[end - 2] == 0 and raw[end - 1] == 0:
+                end -= 2
+            return raw[:end].decode('utf-16le', errors='ignore')
         except:
             return ""
     
@@ -680,6 +894,22 @@ class HwpParser:
         return ['/'.join(entry) for entry in self.ole.listdir()]
 
 
+def _parse_section_bytes(args: tuple[int, bytes, bool]) -> Section:
+    """프로세스 풀 워커: 섹션 원본 바이트를 받아 독립적으로 파싱"""
+    index, raw, is_compressed = args
+    if is_compressed:
+        # FileHeader의 압축 플래그를 신뢰 — 실패하면 손상 파일이므로 그대로 전파
+        raw = zlib.decompress(raw, -15)
+
+    # OLE 핸들 없이 레코드 파싱만 수행하는 빈 파서
+    parser = HwpParser.__new__(HwpParser)
+    parser.is_compressed = is_compressed
+    parser._streams = None
+
+    section = Section(index=index)
+    return parser._parse_section_records(parser._iter_records(raw), section)
+
+
 # =============================================================================
 # 편의 함수
 # =============================================================================
@@ -80,12 +80,58 @@ HWPX 폴더 구조:
 # =============================================================================
 
 from __future__ import annotations  # 반드시 첫 번째 import!
-import xml.etree.ElementTree as ET  # XML 파싱 라이브러리
+
+# lxml은 선택적 의존성 (있으면 libxml2 기반으로 파싱/순회가 C에서 수행됨)
+# 없으면 표준 라이브러리 ElementTree를 동일 API로 사용
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET  # XML 파싱 라이브러리
+    _HAS_LXML = False
+
+# lxml은 ParseError 대신 XMLSyntaxError를 던짐 — 공통 별칭으로 처리
+_XML_PARSE_ERROR = getattr(ET, "ParseError", None) or ET.XMLSyntaxError
 from pathlib import Path            # 파일 경로 처리
-from dataclasses import dataclass, field, asdict  # 데이터 클래스 관련
+from dataclasses import dataclass, field, fields  # 데이터 클래스 관련
 from typing import Iterator, Union, Optional, Any  # 타입 힌트
+import functools                    # cached_property 등 함수 도구
+import io                           # 마크다운 조립용 문자열 버퍼
 import json                         # JSON 변환
 
+# numpy는 선택 의존성 — 있으면 레이아웃 요소의 좌표 배열/페이지 필터가 벡터화됨
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson(러스트 구현)은 선택적 의존성 — indent=2 프리티프린트가
+# 표준 라이브러리의 파이썬 경로보다 수 배 빠름 (출력은 동일한 JSON)
+try:
+    import orjson
+
+    def _dumps(data: Any) -> str:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+except ImportError:
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls) -> tuple[str, ...]:
+    """데이터클래스 필드 이름 목록 (타입별로 한 번만 조회)"""
+    return tuple(f.name for f in fields(cls))
+
+
+def _asdict_shallow(obj) -> dict:
+    """asdict와 달리 중첩 데이터클래스를 재귀 복사하지 않는 얕은 변환
+
+    Size/Margin/Position처럼 스칼라 필드만 가진 클래스의 직렬화에 사용.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
 
 # =============================================================================
 # XML 네임스페이스 정의
@@ -101,6 +147,25 @@ NS = {
 # HWPUNIT을 mm로 변환하는 상수 (1 HWPUNIT = 1/7200 인치)
 HWPUNIT_TO_MM = 25.4 / 7200  # 약 0.00353mm
 
+# 자주 찾는 본문 태그의 네임스페이스 한정 이름
+# iter(tag)에 넘기면 태그 비교가 _elementtree C 확장 내부에서 수행되어
+# 요소마다 파이썬 레벨에서 _strip_ns()로 비교할 필요가 없습니다.
+_HP_TAG = {
+    local: f"{{{NS['hp']}}}{local}"
+    for local in (
+        "p", "run", "t", "lineseg", "linesegarray", "tbl", "tr", "tc",
+        "sz", "pos", "outMargin", "inMargin",
+        "cellSpan", "cellSz", "cellMargin",
+        "pagePr", "margin", "secPr", "subList",
+    )
+}
+
+# 네임스페이스 제거 결과 캐시
+# ElementTree는 태그 문자열을 인턴하므로 실제 종류는 수십 개뿐 —
+# 요소마다 문자열을 자르는 대신 dict 조회 한 번으로 끝냄
+# 표준 hp 태그는 미리 채워 두어 첫 요소부터 미스 없이 조회됨
+_NS_CACHE: dict[str, str] = {qualified: local for local, qualified in _HP_TAG.items()}
+
 
 # =============================================================================
 # 레이아웃 관련 데이터 클래스
@@ -151,7 +216,7 @@ HWPUNIT_TO_MM = 25.4 / 7200  # 약 0.00353mm
 #
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     요소의 위치 정보를 담는 클래스
@@ -185,7 +250,7 @@ class Position:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Size:
     """
     요소의 크기 정보를 담는 클래스
@@ -209,7 +274,7 @@ class Size:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Margin:
     """
     여백 정보를 담는 클래스
@@ -235,7 +300,7 @@ class Margin:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class LineSegment:
     """
     텍스트 라인 세그먼트의 레이아웃 정보
@@ -314,7 +379,7 @@ class LineSegment:
 #
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PageProperties:
     """
     페이지 속성 정보
@@ -345,7 +410,7 @@ class PageProperties:
 # 콘텐츠 데이터 클래스
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """
     테이블의 한 칸(셀)을 나타내는 클래스
@@ -401,10 +466,14 @@ class Table:
         if not self.cells:
             return ""
         
-        grid = [["" for _ in range(self.cols)] for _ in range(self.rows)]
+        # [""] * cols는 행 전체를 C 레벨에서 한 번에 할당 (셀 단위 루프 없음)
+        # 빈 문자열은 불변이므로 참조 공유해도 안전 — 아래에서 바로 덮어씀
+        grid = [[""] * self.cols for _ in range(self.rows)]
         for cell in self.cells:
             if 0 <= cell.row < self.rows and 0 <= cell.col < self.cols:
-                grid[cell.row][cell.col] = cell.text.replace("|", "\\|")
+                # 파이프가 없으면(대부분) 복사본을 만드는 replace를 건너뜀
+                t = cell.text
+                grid[cell.row][cell.col] = t.replace("|", "\\|") if "|" in t else t
         
         lines = []
         for i, row in enumerate(grid):
@@ -416,22 +485,17 @@ class Table:
     
     def to_markdown_with_layout(self) -> str:
         """레이아웃 정보를 포함한 마크다운 테이블"""
-        lines = []
-        
-        # 테이블 메타 정보
+        # 조각 리스트 + join 대신 f-string 한 번으로 조립
         size_mm = self.size.to_mm()
-        lines.append(f"<!-- 테이블 ID: {self.id} -->")
-        lines.append(f"<!-- 크기: {size_mm['width_mm']}mm × {size_mm['height_mm']}mm -->")
-        lines.append(f"<!-- 위치: {self.position.horz_align} / {self.position.vert_align} -->")
-        lines.append("")
-        
-        # 테이블 본문
-        lines.append(self.to_markdown())
-        
-        return "\n".join(lines)
+        return (
+            f"<!-- 테이블 ID: {self.id} -->\n"
+            f"<!-- 크기: {size_mm['width_mm']}mm × {size_mm['height_mm']}mm -->\n"
+            f"<!-- 위치: {self.position.horz_align} / {self.position.vert_align} -->\n"
+            f"\n{self.to_markdown()}"
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class TextRun:
     """
     텍스트 런(run) - 동일한 서식이 적용된 텍스트 조각
@@ -451,8 +515,8 @@ class Paragraph:
     
     Attributes:
         id (str): 문단의 고유 식별자
-        texts (list[str]): 문단에 포함된 텍스트 조각들
         text_runs (list[TextRun]): 서식 정보가 포함된 텍스트 런들
+            (문단의 텍스트 조각은 여기서만 보관 — full_text로 합쳐서 조회)
         tables (list[Table]): 문단에 포함된 테이블들
         para_pr_id (str): 문단 속성 참조 ID
         style_id (str): 스타일 참조 ID
@@ -461,7 +525,6 @@ class Paragraph:
         column_break (bool): 문단 앞에서 단 나누기
     """
     id: str
-    texts: list[str] = field(default_factory=list)
     text_runs: list[TextRun] = field(default_factory=list)
     tables: list[Table] = field(default_factory=list)
     para_pr_id: str = ""
@@ -498,27 +561,47 @@ class Paragraph:
     #
     # ─────────────────────────────────────────────────────────────────────────
     
-    @property
+    @functools.cached_property
     def full_text(self) -> str:
         """
         문단의 전체 텍스트를 하나의 문자열로 반환
-        
+
         사용 예시:
-            para = Paragraph(id="1", texts=["안녕", "하세요"])
+            para = Paragraph(id="1", text_runs=[TextRun("안녕"), TextRun("하세요")])
             print(para.full_text)  # "안녕하세요" (괄호 없이 속성처럼 접근!)
+
+        cached_property이므로 join은 첫 접근 시 한 번만 수행됩니다.
+        (to_markdown/to_json 등 여러 내보내기가 같은 문단을 반복 조회함.
+        파싱이 끝난 뒤에는 text_runs가 변경되지 않으므로 안전합니다.)
         """
-        return "".join(self.texts)
+        return "".join(tr.text for tr in self.text_runs)
     
     def get_bounding_box(self) -> dict | None:
         """문단의 바운딩 박스(위치와 크기)를 반환"""
         if not self.line_segments:
             return None
-        
-        # 모든 라인 세그먼트의 범위 계산
-        min_x = min(ls.horz_pos for ls in self.line_segments)
-        max_x = max(ls.horz_pos + ls.horz_size for ls in self.line_segments)
-        min_y = min(ls.vert_pos for ls in self.line_segments)
-        max_y = max(ls.vert_pos + ls.vert_size for ls in self.line_segments)
+
+        # 모든 라인 세그먼트의 범위 계산 — min/max 제너레이터 4개를 만드는
+        # 대신 한 번의 순회로 누적 (세그먼트당 속성 접근 4회로 끝)
+        it = iter(self.line_segments)
+        ls = next(it)
+        min_x = ls.horz_pos
+        max_x = ls.horz_pos + ls.horz_size
+        min_y = ls.vert_pos
+        max_y = ls.vert_pos + ls.vert_size
+        for ls in it:
+            x = ls.horz_pos
+            if x < min_x:
+                min_x = x
+            x += ls.horz_size
+            if x > max_x:
+                max_x = x
+            y = ls.vert_pos
+            if y < min_y:
+                min_y = y
+            y += ls.vert_size
+            if y > max_y:
+                max_y = y
         
         return {
             "x": min_x,
@@ -587,70 +670,92 @@ class HwpxDocument:
     
     def to_markdown(self) -> str:
         """문서를 마크다운 형식으로 변환 (기본 버전)"""
-        lines = [f"# {self.title}", ""]
-        
+        # 수천 개의 짧은 조각 리스트 대신 StringIO 버퍼에 바로 기록
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# {self.title}\n\n")
+
         for section in self.sections:
-            lines.append(f"## Section {section.index + 1}")
-            lines.append("")
-            
+            w(f"## Section {section.index + 1}\n\n")
+
             for para in section.paragraphs:
                 if para.full_text:
-                    lines.append(para.full_text)
-                    lines.append("")
-                
+                    w(para.full_text)
+                    w("\n\n")
+
                 for table in para.tables:
-                    lines.append(table.to_markdown())
-                    lines.append("")
-        
-        return "\n".join(lines)
+                    w(table.to_markdown())
+                    w("\n\n")
+
+        # join 결과와 동일하게 후행 개행을 하나만 남김
+        return buf.getvalue()[:-1]
     
-    def to_markdown_with_layout(self) -> str:
-        """
-        레이아웃 정보를 포함한 마크다운
-        
-        HTML 주석으로 좌표/크기 정보를 포함합니다.
-        """
-        lines = [f"# {self.title}", ""]
-        
+    def _iter_markdown_with_layout(self) -> Iterator[str]:
+        """레이아웃 포함 마크다운을 조각 단위로 생성 (조립은 호출부 몫)"""
+        yield f"# {self.title}\n\n"
+
         # 문서 메타 정보
-        lines.append("<!-- 문서 정보 -->")
-        lines.append(f"<!-- 버전: {self.version.application} {self.version.app_version} -->")
-        lines.append("")
-        
+        yield f"<!-- 문서 정보 -->\n<!-- 버전: {self.version.application} {self.version.app_version} -->\n\n"
+
         for section in self.sections:
             # 섹션 헤더
-            lines.append(f"## Section {section.index + 1}")
-            lines.append("")
-            
+            yield f"## Section {section.index + 1}\n\n"
+
             # 페이지 정보
             page_mm = section.page_props.to_mm()
-            lines.append(f"<!-- 페이지 크기: {page_mm['width_mm']}mm × {page_mm['height_mm']}mm ({page_mm['orientation']}) -->")
             margin_mm = section.page_props.margin.to_mm()
-            lines.append(f"<!-- 여백: 상{margin_mm['top_mm']}mm 하{margin_mm['bottom_mm']}mm 좌{margin_mm['left_mm']}mm 우{margin_mm['right_mm']}mm -->")
-            lines.append("")
-            
+            yield f"<!-- 페이지 크기: {page_mm['width_mm']}mm × {page_mm['height_mm']}mm ({page_mm['orientation']}) -->\n"
+            yield f"<!-- 여백: 상{margin_mm['top_mm']}mm 하{margin_mm['bottom_mm']}mm 좌{margin_mm['left_mm']}mm 우{margin_mm['right_mm']}mm -->\n\n"
+
             for para in section.paragraphs:
                 # 문단 레이아웃 정보
                 bbox = para.get_bounding_box()
                 if bbox:
-                    lines.append(f"<!-- 문단 위치: ({bbox['x_mm']}mm, {bbox['y_mm']}mm), 크기: {bbox['width_mm']}mm × {bbox['height_mm']}mm -->")
-                
+                    yield f"<!-- 문단 위치: ({bbox['x_mm']}mm, {bbox['y_mm']}mm), 크기: {bbox['width_mm']}mm × {bbox['height_mm']}mm -->\n"
+
                 if para.full_text:
-                    lines.append(para.full_text)
-                    lines.append("")
-                
+                    yield para.full_text
+                    yield "\n\n"
+
                 for table in para.tables:
-                    lines.append(table.to_markdown_with_layout())
-                    lines.append("")
-        
-        return "\n".join(lines)
-    
-    def to_json(self) -> str:
-        """문서를 JSON 형식으로 변환 (기본 버전, 레이아웃 정보 제외)"""
+                    yield table.to_markdown_with_layout()
+                    yield "\n\n"
+
+    def to_markdown_with_layout(self) -> str:
+        """
+        레이아웃 정보를 포함한 마크다운
+
+        HTML 주석으로 좌표/크기 정보를 포함합니다.
+        """
+        # 후행 개행을 하나만 남김
+        return "".join(self._iter_markdown_with_layout())[:-1]
+
+    def dump_markdown_with_layout(self, fp) -> None:
+        """레이아웃 포함 마크다운을 파일 객체에 조각 단위로 기록
+
+        전체 문자열을 메모리에 만들지 않으므로 대형 문서에서 피크
+        메모리가 절반으로 줄어듭니다. 기록 내용은
+        to_markdown_with_layout()과 동일합니다.
+        """
+        prev = None
+        for chunk in self._iter_markdown_with_layout():
+            if prev is not None:
+                fp.write(prev)
+            prev = chunk
+        if prev is not None:
+            # 마지막 조각은 후행 개행 하나를 줄여 문자열 버전과 맞춤
+            fp.write(prev[:-1])
+    
+    def to_json(self, fp=None) -> str | None:
+        """문서를 JSON 형식으로 변환 (기본 버전, 레이아웃 정보 제외)
+
+        fp를 주면 전체 문자열을 만들지 않고 json.dump로 파일 객체에
+        조각 단위로 기록하고 None을 반환합니다.
+        """
         # 기본 정보만 포함
         data = {
             "title": self.title,
-            "version": asdict(self.version),
+            "version": _asdict_shallow(self.version),
             "sections": [
                 {
                     "index": s.index,
@@ -677,18 +782,16 @@ class HwpxDocument:
                 for s in self.sections
             ]
         }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        if fp is not None:
+            json.dump(data, fp, ensure_ascii=False, indent=2)
+            return None
+        return _dumps(data)
     
-    def to_json_with_layout(self) -> str:
-        """
-        레이아웃 정보를 포함한 JSON
-        
-        좌표, 크기, 여백 등의 정보가 모두 포함됩니다.
-        HWPUNIT과 mm 단위 모두 제공합니다.
-        """
+    def _layout_dict(self) -> dict:
+        """레이아웃 포함 JSON의 원본 딕셔너리 구성 (직렬화는 호출부 몫)"""
         data = {
             "title": self.title,
-            "version": asdict(self.version),
+            "version": _asdict_shallow(self.version),
             "metadata": self.metadata,
             "unit_info": {
                 "description": "좌표 단위 정보",
@@ -699,12 +802,20 @@ class HwpxDocument:
         }
         
         for section in self.sections:
+            # asdict는 중첩 데이터클래스를 재귀 복사하므로 필드를 직접 나열
+            pp = section.page_props
+            pm = pp.margin
             section_data = {
                 "index": section.index,
                 "page_properties": {
-                    **asdict(section.page_props),
-                    "size_mm": section.page_props.to_mm(),
-                    "margin_mm": section.page_props.margin.to_mm(),
+                    "width": pp.width,
+                    "height": pp.height,
+                    "landscape": pp.landscape,
+                    "gutter_type": pp.gutter_type,
+                    "margin": {"left": pm.left, "right": pm.right,
+                               "top": pm.top, "bottom": pm.bottom},
+                    "size_mm": pp.to_mm(),
+                    "margin_mm": pm.to_mm(),
                 },
                 "paragraphs": []
             }
@@ -726,7 +837,14 @@ class HwpxDocument:
                         "bounding_box": para.get_bounding_box(),
                         "line_segments": [
                             {
-                                **asdict(ls),
+                                "text_pos": ls.text_pos,
+                                "vert_pos": ls.vert_pos,
+                                "vert_size": ls.vert_size,
+                                "text_height": ls.text_height,
+                                "baseline": ls.baseline,
+                                "spacing": ls.spacing,
+                                "horz_pos": ls.horz_pos,
+                                "horz_size": ls.horz_size,
                                 "position_mm": ls.to_mm(),
                             }
                             for ls in para.line_segments
@@ -747,19 +865,19 @@ class HwpxDocument:
                         "z_order": table.z_order,
                         "layout": {
                             "position": {
-                                **asdict(table.position),
+                                **_asdict_shallow(table.position),
                                 "offset_mm": table.position.to_mm(),
                             },
                             "size": {
-                                **asdict(table.size),
+                                **_asdict_shallow(table.size),
                                 "size_mm": table.size.to_mm(),
                             },
                             "outer_margin": {
-                                **asdict(table.outer_margin),
+                                **_asdict_shallow(table.outer_margin),
                                 "margin_mm": table.outer_margin.to_mm(),
                             },
                             "inner_margin": {
-                                **asdict(table.inner_margin),
+                                **_asdict_shallow(table.inner_margin),
                                 "margin_mm": table.inner_margin.to_mm(),
                             },
                         },
@@ -772,11 +890,11 @@ class HwpxDocument:
                                 "col_span": c.col_span,
                                 "border_fill_id": c.border_fill_id,
                                 "size": {
-                                    **asdict(c.size),
+                                    **_asdict_shallow(c.size),
                                     "size_mm": c.size.to_mm(),
                                 },
                                 "margin": {
-                                    **asdict(c.margin),
+                                    **_asdict_shallow(c.margin),
                                     "margin_mm": c.margin.to_mm(),
                                 },
                             }
@@ -786,10 +904,51 @@ class HwpxDocument:
                     para_data["tables"].append(table_data)
                 
                 section_data["paragraphs"].append(para_data)
-            
+
             data["sections"].append(section_data)
-        
-        return json.dumps(data, ensure_ascii=False, indent=2)
+
+        return data
+
+    @functools.cached_property
+    def _layout_json(self) -> str:
+        """레이아웃 JSON 직렬화 결과 캐시
+
+        파싱 후 문서는 사실상 불변이므로, 여러 호출부(미리보기/저장/요약)
+        가 같은 문자열을 재사용할 수 있습니다. 대형 문서에서 메모리를
+        돌려받으려면 drop_layout_json_cache()를 호출하세요.
+        """
+        return _dumps(self._layout_dict())
+
+    def to_json_with_layout(self, fp=None) -> str | None:
+        """
+        레이아웃 정보를 포함한 JSON
+
+        좌표, 크기, 여백 등의 정보가 모두 포함됩니다.
+        HWPUNIT과 mm 단위 모두 제공합니다.
+        직렬화 결과는 캐시되므로 반복 호출해도 비용은 한 번입니다.
+        fp를 주면 dump_json_with_layout처럼 파일 객체에 바로 기록하고
+        None을 반환합니다 (캐시가 이미 있으면 그 문자열을 재사용).
+        """
+        if fp is not None:
+            cached = self.__dict__.get("_layout_json")
+            if cached is not None:
+                fp.write(cached)
+            else:
+                self.dump_json_with_layout(fp)
+            return None
+        return self._layout_json
+
+    def drop_layout_json_cache(self) -> None:
+        """캐시된 레이아웃 JSON 문자열 해제 (대형 문서의 메모리 반환용)"""
+        self.__dict__.pop("_layout_json", None)
+
+    def dump_json_with_layout(self, fp) -> None:
+        """레이아웃 포함 JSON을 파일 객체에 직접 기록
+
+        json.dump가 조각 단위로 쓰므로 to_json_with_layout()처럼
+        전체 문자열을 중간에 만들지 않습니다.
+        """
+        json.dump(self._layout_dict(), fp, ensure_ascii=False, indent=2)
 
 
 # =============================================================================
@@ -834,13 +993,25 @@ class HwpxFolderParser:
             raise FileNotFoundError(f"Contents 폴더를 찾을 수 없습니다: {self.contents_dir}")
     
     def parse(self) -> HwpxDocument:
-        """HWPX 폴더 전체를 파싱합니다."""
+        """HWPX 폴더 전체를 파싱합니다.
+
+        섹션 XML은 서로 독립적이므로 여러 개일 때는 프로세스 풀에서
+        병렬로 파싱합니다 (한 개면 풀 기동 비용을 피해 순차 처리).
+        """
         doc = HwpxDocument(folder_path=self.folder_path)
-        
+
         doc.version = self._parse_version()
         doc.metadata = self._parse_metadata()
-        doc.sections = list(self._parse_sections())
-        
+
+        section_files = sorted(self.contents_dir.glob("section*.xml"))
+        if len(section_files) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            args = [(str(path), idx) for idx, path in enumerate(section_files)]
+            with ProcessPoolExecutor() as executor:
+                doc.sections = list(executor.map(_parse_section_file, args))
+        else:
+            doc.sections = list(self._parse_sections())
+
         return doc
     
     def _parse_version(self) -> VersionInfo:
@@ -850,12 +1021,12 @@ class HwpxFolderParser:
         
         if version_file.exists():
             try:
-                tree = ET.parse(version_file)
+                tree = ET.parse(str(version_file))
                 root = tree.getroot()
                 info.application = root.get("application", "")
                 info.app_version = root.get("appVersion", "")
                 info.xml_version = root.get("xmlVersion", "")
-            except ET.ParseError:
+            except _XML_PARSE_ERROR:
                 pass
         
         return info
@@ -867,21 +1038,34 @@ class HwpxFolderParser:
         
         if header_file.exists():
             try:
-                tree = ET.parse(header_file)
+                tree = ET.parse(str(header_file))
                 root = tree.getroot()
                 
+                ns_get = _NS_CACHE.get
+                strip = self._strip_ns
                 for elem in root.iter():
-                    tag = self._strip_ns(elem.tag)
-                    
+                    tag = ns_get(elem.tag)
+                    if tag is None:
+                        tag = strip(elem.tag)
+
                     if elem.attrib:
-                        if tag not in meta:
-                            meta[tag] = []
-                        meta[tag].append(dict(elem.attrib))
-                    
-                    if elem.text and elem.text.strip():
-                        meta[f"{tag}_text"] = elem.text.strip()
+                        # 한 번만 나오는 태그가 대부분 — 싱글턴 리스트를 만들지
+                        # 않고 dict로 두었다가 두 번째 등장 시 리스트로 승격
+                        existing = meta.get(tag)
+                        if existing is None:
+                            meta[tag] = dict(elem.attrib)
+                        elif isinstance(existing, dict):
+                            meta[tag] = [existing, dict(elem.attrib)]
+                        else:
+                            existing.append(dict(elem.attrib))
+
+                    text = elem.text
+                    if text:
+                        text = text.strip()  # strip은 한 번만
+                        if text:
+                            meta[f"{tag}_text"] = text
                         
-            except ET.ParseError:
+            except _XML_PARSE_ERROR:
                 pass
         
         return meta
@@ -894,50 +1078,185 @@ class HwpxFolderParser:
             yield self._parse_section(section_file, idx)
     
     def _parse_section(self, section_file: Path, index: int) -> Section:
-        """단일 섹션 파싱"""
+        """단일 섹션 파싱 (스트리밍 이벤트를 자료구조로 수집)"""
+        section = None
+        paragraphs = []
+        for event, value in self._iter_section_events(section_file, index):
+            if event == "para":
+                paragraphs.append(value)
+            else:  # "section_end"
+                section = value
+        section.paragraphs = paragraphs
+        return section
+
+    def _iter_section_events(self, section_file: Path, index: int) -> Iterator[tuple]:
+        """단일 섹션을 스트리밍 파싱하며 (이벤트, 값) 튜플을 내보냄
+
+        이벤트 종류:
+            ("para", Paragraph)     — 완성된 최상위 문단 (소비 후 버려도 됨)
+            ("section_end", Section) — 페이지 속성이 채워진 섹션 골격 (문단 제외)
+
+        전체 DOM을 만드는 ET.parse 대신 iterparse로 스트리밍 파싱합니다.
+        최상위 문단 하나가 끝날 때마다 파싱 후 clear()로 하위 트리를
+        해제하므로 피크 메모리가 파일 크기가 아니라 가장 큰 문단
+        크기에 비례합니다. 소비자가 문단을 즉시 출력 포맷으로 바꿔
+        버리면 문서 트리 전체가 메모리에 머무르지 않습니다 (SAX 대 DOM).
+        """
         section = Section(index=index)
-        
+        strip = self._strip_ns
+        ns_get = _NS_CACHE.get  # 사전 채움된 태그 맵 — 요소당 dict 조회 한 번
+        root = None
+        p_depth = 0  # 표 셀 내부의 중첩 p를 구분하기 위한 깊이
+
         try:
-            tree = ET.parse(section_file)
-            root = tree.getroot()
-            
-            # 페이지 속성 추출
-            section.page_props = self._parse_page_properties(root)
-            
-            # 문단 추출
-            for p_elem in root.iter():
-                if self._strip_ns(p_elem.tag) == "p":
-                    para = self._parse_paragraph(p_elem)
-                    if para.texts or para.tables:
-                        section.paragraphs.append(para)
-                        
-        except ET.ParseError as e:
+            for event, elem in ET.iterparse(str(section_file), events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    if (ns_get(elem.tag) or strip(elem.tag)) == "p":
+                        p_depth += 1
+                    continue
+
+                tag = ns_get(elem.tag)
+                if tag is None:
+                    tag = strip(elem.tag)
+
+                if tag == "p":
+                    p_depth -= 1
+                    if p_depth == 0:
+                        # 최상위 문단이 완성된 시점 — 파싱 후 즉시 해제
+                        para = self._parse_paragraph(elem)
+                        if para.text_runs or para.tables:
+                            yield ("para", para)
+                        elem.clear()
+                        if root is not None:
+                            try:
+                                root.remove(elem)
+                            except ValueError:
+                                pass  # root 직속이 아닌 경우
+
+                elif tag == "pagePr":
+                    a = elem.attrib
+                    props = section.page_props
+                    props.width = int(a.get("width", 0))
+                    props.height = int(a.get("height", 0))
+                    props.landscape = a.get("landscape", "NARROWLY")
+                    props.gutter_type = a.get("gutterType", "LEFT_ONLY")
+
+                elif tag == "margin":  # hp:margin은 pagePr 하위에서만 등장
+                    a = elem.attrib
+                    section.page_props.margin = Margin(
+                        left=int(a.get("left", 0)),
+                        right=int(a.get("right", 0)),
+                        top=int(a.get("top", 0)),
+                        bottom=int(a.get("bottom", 0))
+                    )
+
+        except _XML_PARSE_ERROR as e:
             print(f"XML 파싱 오류 ({section_file}): {e}")
-        
-        return section
-    
+
+        yield ("section_end", section)
+
+    def stream_markdown(self, writer) -> None:
+        """문서를 HwpxDocument로 만들지 않고 마크다운을 writer에 바로 기록
+
+        문단이 완성될 때마다 즉시 기록하고 버리므로 문서 크기와 무관하게
+        일정한 메모리로 동작합니다.
+
+        Args:
+            writer: write(str)를 지원하는 객체 (열린 텍스트 파일 등)
+        """
+        w = writer.write
+        w(f"# {self.folder_path.name}\n\n")
+
+        section_files = sorted(self.contents_dir.glob("section*.xml"))
+        for idx, section_file in enumerate(section_files):
+            w(f"## Section {idx + 1}\n\n")
+            for event, para in self._iter_section_events(section_file, idx):
+                if event != "para":
+                    continue
+                if para.full_text:
+                    w(para.full_text)
+                    w("\n\n")
+                for table in para.tables:
+                    w(table.to_markdown())
+                    w("\n\n")
+
+    def stream_json(self, writer) -> None:
+        """to_json과 같은 구조의 JSON을 문단 단위로 writer에 바로 기록"""
+        w = writer.write
+        w('{"title": ')
+        w(json.dumps(self.folder_path.name, ensure_ascii=False))
+        w(', "version": ')
+        w(json.dumps(_asdict_shallow(self._parse_version()), ensure_ascii=False))
+        w(', "sections": [')
+
+        section_files = sorted(self.contents_dir.glob("section*.xml"))
+        for idx, section_file in enumerate(section_files):
+            if idx:
+                w(', ')
+            w('{"index": %d, "paragraphs": [' % idx)
+            first = True
+            for event, para in self._iter_section_events(section_file, idx):
+                if event != "para":
+                    continue
+                para_data = {
+                    "id": para.id,
+                    "text": para.full_text,
+                    "tables": [
+                        {
+                            "rows": t.rows,
+                            "cols": t.cols,
+                            "cells": [
+                                {"row": c.row, "col": c.col, "text": c.text}
+                                for c in t.cells
+                            ]
+                        }
+                        for t in para.tables
+                    ]
+                }
+                if not first:
+                    w(', ')
+                w(json.dumps(para_data, ensure_ascii=False))
+                first = False
+            w(']}')
+        w(']}')
+
+    def _iter_hp(self, elem, local: str) -> Iterator:
+        """hp 네임스페이스 한정 태그로 하위 요소 순회
+
+        iter(tag)는 태그 비교를 C 확장 내부에서 수행하므로 요소마다
+        파이썬에서 _strip_ns()를 호출하는 것보다 훨씬 빠릅니다.
+        표준 네임스페이스가 아닌 문서는 기존 비교 방식으로 폴백합니다.
+        """
+        found = False
+        for child in elem.iter(_HP_TAG[local]):
+            found = True
+            yield child
+        if not found:
+            strip = self._strip_ns
+            for child in elem.iter():
+                if strip(child.tag) == local:
+                    yield child
+
     def _parse_page_properties(self, root) -> PageProperties:
         """페이지 속성 추출"""
         props = PageProperties()
-        
-        # pagePr 요소 찾기
-        for elem in root.iter():
-            tag = self._strip_ns(elem.tag)
-            
-            if tag == "pagePr":
-                props.width = int(elem.get("width", 0))
-                props.height = int(elem.get("height", 0))
-                props.landscape = elem.get("landscape", "NARROWLY")
-                props.gutter_type = elem.get("gutterType", "LEFT_ONLY")
-            
-            elif tag == "margin":
-                props.margin = Margin(
-                    left=int(elem.get("left", 0)),
-                    right=int(elem.get("right", 0)),
-                    top=int(elem.get("top", 0)),
-                    bottom=int(elem.get("bottom", 0))
-                )
-        
+
+        for elem in self._iter_hp(root, "pagePr"):
+            props.width = int(elem.get("width", 0))
+            props.height = int(elem.get("height", 0))
+            props.landscape = elem.get("landscape", "NARROWLY")
+            props.gutter_type = elem.get("gutterType", "LEFT_ONLY")
+
+        for elem in self._iter_hp(root, "margin"):
+            props.margin = Margin(
+                left=int(elem.get("left", 0)),
+                right=int(elem.get("right", 0)),
+                top=int(elem.get("top", 0)),
+                bottom=int(elem.get("bottom", 0))
+            )
+
         return props
     
     def _parse_paragraph(self, p_elem) -> Paragraph:
@@ -950,37 +1269,55 @@ class HwpxFolderParser:
             column_break=p_elem.get("columnBreak", "0") == "1",
         )
         
-        for elem in p_elem.iter():
-            tag = self._strip_ns(elem.tag)
-            
-            # 텍스트 런 추출
-            if tag == "run":
-                char_pr_id = elem.get("charPrIDRef", "")
-                for child in elem.iter():
-                    if self._strip_ns(child.tag) == "t" and child.text:
-                        para.texts.append(child.text)
-                        para.text_runs.append(TextRun(text=child.text, char_pr_id=char_pr_id))
-            
-            # 라인 세그먼트 추출
-            elif tag == "lineseg":
-                ls = LineSegment(
-                    text_pos=int(elem.get("textpos", 0)),
-                    vert_pos=int(elem.get("vertpos", 0)),
-                    vert_size=int(elem.get("vertsize", 0)),
-                    text_height=int(elem.get("textheight", 0)),
-                    baseline=int(elem.get("baseline", 0)),
-                    spacing=int(elem.get("spacing", 0)),
-                    horz_pos=int(elem.get("horzpos", 0)),
-                    horz_size=int(elem.get("horzsize", 0)),
-                )
-                para.line_segments.append(ls)
-            
-            # 테이블 추출
-            elif tag == "tbl":
-                table = self._parse_table(elem)
-                if table:
-                    para.tables.append(table)
-        
+        # 하위 트리를 정확히 한 번만 내려가는 재귀 탐색.
+        # iter() 전체 순회 + 태그별 재순회 방식과 달리, 표(tbl)를 만나면
+        # _parse_table에 소비를 맡기고 그 아래로는 내려가지 않으므로
+        # 표 내부 텍스트가 문단 텍스트로 중복 수집되지 않습니다.
+        strip = self._strip_ns
+        ns_get = _NS_CACHE.get  # 사전 채움된 태그 맵 — 요소당 dict 조회 한 번
+        text_runs = para.text_runs
+        line_segments = para.line_segments
+        tables = para.tables
+
+        def walk(elem, char_pr_id: str) -> None:
+            for child in elem:
+                tag = ns_get(child.tag)
+                if tag is None:
+                    tag = strip(child.tag)
+
+                # 텍스트 — 현재 run의 문자 속성을 이어받음
+                if tag == "t":
+                    if child.text:
+                        text_runs.append(TextRun(text=child.text, char_pr_id=char_pr_id))
+
+                # 라인 세그먼트
+                elif tag == "lineseg":
+                    a = child.attrib
+                    line_segments.append(LineSegment(
+                        text_pos=int(a.get("textpos", 0)),
+                        vert_pos=int(a.get("vertpos", 0)),
+                        vert_size=int(a.get("vertsize", 0)),
+                        text_height=int(a.get("textheight", 0)),
+                        baseline=int(a.get("baseline", 0)),
+                        spacing=int(a.get("spacing", 0)),
+                        horz_pos=int(a.get("horzpos", 0)),
+                        horz_size=int(a.get("horzsize", 0)),
+                    ))
+
+                # 테이블 — 하위 트리는 _parse_table이 소비
+                elif tag == "tbl":
+                    table = self._parse_table(child)
+                    if table:
+                        tables.append(table)
+
+                # 텍스트 런 — 문자 속성을 갱신하며 하위로 내려감
+                elif tag == "run":
+                    walk(child, child.get("charPrIDRef", ""))
+
+                else:
+                    walk(child, char_pr_id)
+
+        walk(p_elem, "")
         return para
     
     def _parse_table(self, tbl_elem) -> Table | None:
@@ -999,98 +1336,122 @@ class HwpxFolderParser:
         )
         
         # 테이블 레이아웃 정보 추출
+        ns_get = _NS_CACHE.get
         for elem in tbl_elem:
-            tag = self._strip_ns(elem.tag)
-            
+            tag = ns_get(elem.tag) or self._strip_ns(elem.tag)
+            # attrib를 한 번만 바인딩해 속성 조회마다의 메서드 디스패치 제거
+            a = elem.attrib
+
             if tag == "sz":
                 table.size = Size(
-                    width=int(elem.get("width", 0)),
-                    height=int(elem.get("height", 0)),
-                    width_rel_to=elem.get("widthRelTo", "ABSOLUTE"),
-                    height_rel_to=elem.get("heightRelTo", "ABSOLUTE"),
+                    width=int(a.get("width", 0)),
+                    height=int(a.get("height", 0)),
+                    width_rel_to=a.get("widthRelTo", "ABSOLUTE"),
+                    height_rel_to=a.get("heightRelTo", "ABSOLUTE"),
                 )
-            
+
             elif tag == "pos":
                 table.position = Position(
-                    vert_rel_to=elem.get("vertRelTo", ""),
-                    horz_rel_to=elem.get("horzRelTo", ""),
-                    vert_align=elem.get("vertAlign", ""),
-                    horz_align=elem.get("horzAlign", ""),
-                    vert_offset=int(elem.get("vertOffset", 0)),
-                    horz_offset=int(elem.get("horzOffset", 0)),
-                    treat_as_char=elem.get("treatAsChar", "0") == "1",
-                    flow_with_text=elem.get("flowWithText", "0") == "1",
+                    vert_rel_to=a.get("vertRelTo", ""),
+                    horz_rel_to=a.get("horzRelTo", ""),
+                    vert_align=a.get("vertAlign", ""),
+                    horz_align=a.get("horzAlign", ""),
+                    vert_offset=int(a.get("vertOffset", 0)),
+                    horz_offset=int(a.get("horzOffset", 0)),
+                    treat_as_char=a.get("treatAsChar", "0") == "1",
+                    flow_with_text=a.get("flowWithText", "0") == "1",
                 )
-            
+
             elif tag == "outMargin":
                 table.outer_margin = Margin(
-                    left=int(elem.get("left", 0)),
-                    right=int(elem.get("right", 0)),
-                    top=int(elem.get("top", 0)),
-                    bottom=int(elem.get("bottom", 0)),
+                    left=int(a.get("left", 0)),
+                    right=int(a.get("right", 0)),
+                    top=int(a.get("top", 0)),
+                    bottom=int(a.get("bottom", 0)),
                 )
-            
+
             elif tag == "inMargin":
                 table.inner_margin = Margin(
-                    left=int(elem.get("left", 0)),
-                    right=int(elem.get("right", 0)),
-                    top=int(elem.get("top", 0)),
-                    bottom=int(elem.get("bottom", 0)),
+                    left=int(a.get("left", 0)),
+                    right=int(a.get("right", 0)),
+                    top=int(a.get("top", 0)),
+                    bottom=int(a.get("bottom", 0)),
                 )
         
-        # 셀 추출
+        # 셀 추출 (행/셀 태그 필터는 C 레벨에서 수행)
+        # rowCnt×colCnt를 이미 알고 있으므로 리스트를 선할당해
+        # append 반복에 따른 중간 재할당을 피함
+        total = rows * cols
+        cells = [None] * total
+        k = 0
         row_idx = 0
-        for elem in tbl_elem.iter():
-            tag = self._strip_ns(elem.tag)
-            
-            if tag == "tr":
-                col_idx = 0
-                for cell_elem in elem.iter():
-                    if self._strip_ns(cell_elem.tag) == "tc":
-                        cell = self._parse_table_cell(cell_elem, row_idx, col_idx)
-                        table.cells.append(cell)
-                        col_idx += 1
-                row_idx += 1
-        
+        for tr_elem in self._iter_hp(tbl_elem, "tr"):
+            col_idx = 0
+            for cell_elem in self._iter_hp(tr_elem, "tc"):
+                cell = self._parse_table_cell(cell_elem, row_idx, col_idx)
+                if k < total:
+                    cells[k] = cell
+                else:
+                    cells.append(cell)  # 선언된 수보다 셀이 많은 비정상 문서
+                k += 1
+                col_idx += 1
+            row_idx += 1
+        del cells[k:]  # 병합 등으로 선언보다 적으면 잘라냄
+        table.cells = cells
+
         return table
     
     def _parse_table_cell(self, tc_elem, row: int, col: int) -> TableCell:
-        """테이블 셀 파싱"""
-        # 셀 텍스트 추출
+        """테이블 셀 파싱 (텍스트와 레이아웃을 한 번의 순회로 수집)"""
         cell_texts = []
-        for t_elem in tc_elem.iter():
-            if self._strip_ns(t_elem.tag) == "t" and t_elem.text:
-                cell_texts.append(t_elem.text)
-        
+        row_span = col_span = 1
+        size = None
+        margin = None
+
+        ns_get = _NS_CACHE.get
+        strip = self._strip_ns
+        for elem in tc_elem.iter():
+            tag = ns_get(elem.tag)
+            if tag is None:
+                tag = strip(elem.tag)
+
+            if tag == "t":
+                if elem.text:
+                    cell_texts.append(elem.text)
+
+            elif tag == "cellSpan":
+                a = elem.attrib
+                row_span = int(a.get("rowSpan", 1))
+                col_span = int(a.get("colSpan", 1))
+
+            elif tag == "cellSz":
+                a = elem.attrib
+                size = Size(
+                    width=int(a.get("width", 0)),
+                    height=int(a.get("height", 0)),
+                )
+
+            elif tag == "cellMargin":
+                a = elem.attrib
+                margin = Margin(
+                    left=int(a.get("left", 0)),
+                    right=int(a.get("right", 0)),
+                    top=int(a.get("top", 0)),
+                    bottom=int(a.get("bottom", 0)),
+                )
+
         cell = TableCell(
             row=row,
             col=col,
             text=" ".join(cell_texts),
+            row_span=row_span,
+            col_span=col_span,
             border_fill_id=tc_elem.get("borderFillIDRef", ""),
         )
-        
-        # 셀 레이아웃 정보 추출
-        for elem in tc_elem.iter():
-            tag = self._strip_ns(elem.tag)
-            
-            if tag == "cellSpan":
-                cell.row_span = int(elem.get("rowSpan", 1))
-                cell.col_span = int(elem.get("colSpan", 1))
-            
-            elif tag == "cellSz":
-                cell.size = Size(
-                    width=int(elem.get("width", 0)),
-                    height=int(elem.get("height", 0)),
-                )
-            
-            elif tag == "cellMargin":
-                cell.margin = Margin(
-                    left=int(elem.get("left", 0)),
-                    right=int(elem.get("right", 0)),
-                    top=int(elem.get("top", 0)),
-                    bottom=int(elem.get("bottom", 0)),
-                )
-        
+        if size is not None:
+            cell.size = size
+        if margin is not None:
+            cell.margin = margin
         return cell
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -1145,10 +1506,27 @@ class HwpxFolderParser:
         
         이 메서드는 self를 사용하지 않으므로 @staticmethod로 정의합니다.
         클래스 이름으로 직접 호출 가능: HwpxFolderParser._strip_ns(tag)
+
+        결과는 모듈 레벨 _NS_CACHE에 캐시됩니다. 태그 종류는 소수이므로
+        두 번째 호출부터는 문자열 분리 없이 dict 조회만 수행합니다.
         """
-        if "}" in tag:
-            return tag.split("}")[-1]
-        return tag
+        stripped = _NS_CACHE.get(tag)
+        if stripped is None:
+            # rpartition은 split과 달리 중간 리스트를 만들지 않음
+            stripped = tag.rpartition("}")[2]
+            _NS_CACHE[tag] = stripped
+        return stripped
+
+
+def _parse_section_file(args: tuple[str, int]) -> Section:
+    """프로세스 풀 워커: 섹션 XML 파일 하나를 독립적으로 파싱
+
+    _parse_section은 폴더 상태를 참조하지 않으므로 빈 파서 인스턴스로
+    바로 호출할 수 있습니다 (피클 가능한 모듈 레벨 함수여야 함).
+    """
+    path, index = args
+    parser = HwpxFolderParser.__new__(HwpxFolderParser)
+    return parser._parse_section(Path(path), index)
 
 
 # =============================================================================
@@ -1225,7 +1603,8 @@ def parse_hwpx(file_path: str | Path, extract_dir: str | Path | None = None) ->
 
 if __name__ == "__main__":
     import sys
-    
+    from operator import attrgetter
+
     if len(sys.argv) > 1:
         folder = sys.argv[1]
     else:
@@ -1249,7 +1628,8 @@ if __name__ == "__main__":
         page_mm = section.page_props.to_mm()
         print(f"  페이지: {page_mm['width_mm']}mm × {page_mm['height_mm']}mm ({page_mm['orientation']})")
         
-        table_count = sum(len(p.tables) for p in section.paragraphs)
+        # map 체인은 제너레이터 표현식의 프레임 오버헤드 없이 C 레벨에서 집계됨
+        table_count = sum(map(len, map(attrgetter("tables"), section.paragraphs)))
         if table_count:
             print(f"  테이블 수: {table_count}")
     
@@ -1267,19 +1647,19 @@ if __name__ == "__main__":
     json_str = doc.to_json_with_layout()
     print(json_str[:3000] if len(json_str) > 3000 else json_str)
     
-    # 파일로 저장
+    # 파일로 저장 (미리보기에 쓴 문자열을 재사용 — 재직렬화 없음)
     output_dir = Path(folder).parent
-    
+
     # JSON 저장
     json_file = output_dir / f"{doc.title}_layout.json"
     with open(json_file, "w", encoding="utf-8") as f:
-        f.write(doc.to_json_with_layout())
+        f.write(json_str)
     print(f"\n✅ JSON 저장: {json_file}")
-    
+
     # 마크다운 저장
     md_file = output_dir / f"{doc.title}_layout.md"
     with open(md_file, "w", encoding="utf-8") as f:
-        f.write(doc.to_markdown_with_layout())
+        f.write(md)
     print(f"✅ 마크다운 저장: {md_file}")
 
 
@@ -1295,11 +1675,11 @@ if __name__ == "__main__":
 #
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LayoutElement:
     """
     레이아웃 요소 - 화면에 그릴 수 있는 단위
-    
+
     Attributes:
         element_type (str): 요소 유형 ("text", "table", "table_cell")
         text (str): 텍스트 내용
@@ -1311,7 +1691,7 @@ class LayoutElement:
         section (int): 섹션 번호
         para_id (str): 문단 ID
         style_id (str): 스타일 ID
-        metadata (dict): 추가 메타데이터
+        metadata (dict | None): 추가 메타데이터 (없으면 None — 생성 비용 절약)
     """
     element_type: str
     text: str
@@ -1323,8 +1703,8 @@ class LayoutElement:
     section: int = 0
     para_id: str = ""
     style_id: str = ""
-    metadata: dict = field(default_factory=dict)
-    
+    metadata: dict | None = None
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
@@ -1340,11 +1720,188 @@ class LayoutElement:
             "section": self.section,
             "para_id": self.para_id,
             "style_id": self.style_id,
-            "metadata": self.metadata,
+            "metadata": self.metadata or {},
         }
 
 
+# metadata는 시각화 경로에서 거의 읽히지 않으므로, 추출 단계에서는 값 튜플만
+# 저장해 두고 딕셔너리는 요소 뷰를 만들 때(직렬화 등) 지연 생성한다.
+# 유형별 키 순서는 기존 metadata 딕셔너리와 동일.
+_META_KEYS = {
+    "text": ("para_pr_id", "line_count"),
+    "table": ("rows", "cols", "id", "z_order"),
+    "table_cell": ("row", "col", "row_span", "col_span"),
+}
+
+
+def _build_metadata(elem_type: str, values: tuple | None) -> dict:
+    """저장된 값 튜플을 요소 유형에 맞는 metadata 딕셔너리로 복원"""
+    if values is None:
+        return {}
+    keys = _META_KEYS.get(elem_type)
+    if keys is None:
+        return {}
+    return dict(zip(keys, values))
+
+
 @dataclass
+class LayoutElementSoA:
+    """
+    레이아웃 요소의 SoA(Structure-of-Arrays) 컨테이너
+
+    요소마다 LayoutElement 객체를 만드는 대신(AoS), 같은 필드끼리 모은
+    병렬 배열로 저장합니다. 셀이 수천 개인 문서에서 작은 객체 수천 개의
+    할당을 없애고, numpy가 있으면 좌표(x/y/width/height)와 페이지 번호가
+    연속된 배열이 되어 페이지 필터링이 단일 벡터 비교로 끝납니다.
+
+    기존 호출부와의 호환을 위해 인덱싱(`soa[i]`)과 순회는 LayoutElement
+    뷰를 그때그때 만들어 돌려줍니다.
+
+    Attributes:
+        x, y, width, height: 좌표/크기 배열 (mm, numpy float32 또는 리스트)
+        page: 페이지 번호 배열 (numpy int32 또는 리스트)
+        element_type, text, section, para_id, style_id: 파이썬 리스트
+        display_text: 렌더링용 표시 문자열 (strip + 말줄임을 추출 시 선계산)
+        metadata: 유형별 값 튜플 리스트 (_META_KEYS 순서, 딕셔너리는 지연 생성)
+    """
+    x: Any
+    y: Any
+    width: Any
+    height: Any
+    page: Any
+    element_type: list
+    text: list
+    section: list
+    para_id: list
+    style_id: list
+    metadata: list
+    display_text: list
+
+    @classmethod
+    def empty(cls, n: int) -> "LayoutElementSoA":
+        """요소 n개 분량을 미리 할당한 빈 컨테이너 생성"""
+        if np is not None:
+            return cls(
+                x=np.empty(n, np.float32),
+                y=np.empty(n, np.float32),
+                width=np.empty(n, np.float32),
+                height=np.empty(n, np.float32),
+                page=np.empty(n, np.int32),
+                element_type=[None] * n,
+                text=[None] * n,
+                section=[0] * n,
+                para_id=[""] * n,
+                style_id=[""] * n,
+                metadata=[None] * n,
+                display_text=[""] * n,
+            )
+        return cls(
+            x=[0.0] * n,
+            y=[0.0] * n,
+            width=[0.0] * n,
+            height=[0.0] * n,
+            page=[0] * n,
+            element_type=[None] * n,
+            text=[None] * n,
+            section=[0] * n,
+            para_id=[""] * n,
+            style_id=[""] * n,
+            metadata=[None] * n,
+            display_text=[""] * n,
+        )
+
+    def truncate(self, n: int) -> None:
+        """채워진 n개만 남기고 뒤쪽 여분 슬롯 제거 (사전 집계가 상한이므로)"""
+        if n == len(self.element_type):
+            return
+        self.x = self.x[:n]
+        self.y = self.y[:n]
+        self.width = self.width[:n]
+        self.height = self.height[:n]
+        self.page = self.page[:n]
+        del self.element_type[n:]
+        del self.text[n:]
+        del self.section[n:]
+        del self.para_id[n:]
+        del self.style_id[n:]
+        del self.metadata[n:]
+        del self.display_text[n:]
+
+    def __len__(self) -> int:
+        return len(self.element_type)
+
+    def __getitem__(self, i: int) -> LayoutElement:
+        """i번째 요소를 LayoutElement 뷰로 지연 생성
+
+        좌표는 float32로 저장되므로 원래의 mm 반올림 자리수(2)로
+        되돌려서 돌려줍니다.
+        """
+        return LayoutElement(
+            element_type=self.element_type[i],
+            text=self.text[i],
+            x=round(float(self.x[i]), 2),
+            y=round(float(self.y[i]), 2),
+            width=round(float(self.width[i]), 2),
+            height=round(float(self.height[i]), 2),
+            page=int(self.page[i]),
+            section=self.section[i],
+            para_id=self.para_id[i],
+            style_id=self.style_id[i],
+            metadata=_build_metadata(self.element_type[i], self.metadata[i]),
+        )
+
+    def __iter__(self) -> Iterator[LayoutElement]:
+        for i in range(len(self.element_type)):
+            yield self[i]
+
+    def to_columns(self) -> dict:
+        """직렬화용 컬럼형(columnar) 딕셔너리 변환
+
+        요소마다 중첩 딕셔너리를 만드는 대신 필드별 리스트 하나씩만
+        생성합니다 — 요소 N개에 반복되던 키 문자열이 사라져 파이썬
+        객체 그래프와 JSON 출력 크기가 모두 줄어듭니다.
+        """
+        if np is not None:
+            xs = [round(v, 2) for v in self.x.tolist()]
+            ys = [round(v, 2) for v in self.y.tolist()]
+            ws = [round(v, 2) for v in self.width.tolist()]
+            hs = [round(v, 2) for v in self.height.tolist()]
+            page = self.page.tolist()
+        else:
+            xs = list(self.x)
+            ys = list(self.y)
+            ws = list(self.width)
+            hs = list(self.height)
+            page = list(self.page)
+        return {
+            "type": list(self.element_type),
+            "text": list(self.text),
+            "x": xs,
+            "y": ys,
+            "width": ws,
+            "height": hs,
+            "page": page,
+            "section": list(self.section),
+            "para_id": list(self.para_id),
+            "style_id": list(self.style_id),
+            "metadata": [
+                _build_metadata(t, m)
+                for t, m in zip(self.element_type, self.metadata)
+            ],
+        }
+
+    def page_indices(self, page_num: int):
+        """해당 페이지에 속한 요소의 인덱스 배열
+
+        numpy가 있으면 `page == page_num` 단일 벡터 비교 —
+        파이썬 리스트 컴프리헨션 필터를 대체합니다.
+        """
+        if np is not None:
+            return np.nonzero(self.page == page_num)[0]
+        return [i for i, p in enumerate(self.page) if p == page_num]
+
+
+@dataclass(slots=True)
 class PageInfo:
     """
     페이지 정보
@@ -1367,34 +1924,73 @@ class PageInfo:
     margin_right: float = 0
 
 
-def extract_layout_elements(doc: HwpxDocument) -> tuple[list[LayoutElement], list[PageInfo]]:
+@functools.lru_cache(maxsize=4096)
+def _size_mm_pair(width: int, height: int) -> tuple[float, float]:
+    """(width, height) HWPUNIT → (mm, mm) 변환 결과 캐시
+
+    표 셀은 같은 크기가 수백 번 반복되는 경우가 많아, 셀마다
+    Size.to_mm()으로 딕셔너리를 새로 만드는 대신 튜플 하나를 재사용합니다.
+    """
+    return (round(width * HWPUNIT_TO_MM, 2), round(height * HWPUNIT_TO_MM, 2))
+
+
+def _display_text(text: str) -> str:
+    """렌더링용 표시 문자열 — 공백 제거 후 30자 초과분은 말줄임
+
+    추출 시 한 번만 계산해 두면 렌더 루프에서 요소마다 strip/slice를
+    반복하지 않습니다.
+    """
+    text = text.strip()
+    if len(text) > 30:
+        return text[:27] + "..."
+    return text
+
+
+def extract_layout_elements(doc: HwpxDocument) -> tuple[LayoutElementSoA, list[PageInfo]]:
     """
     문서에서 레이아웃 요소들을 추출합니다.
-    
+
     이 함수는 doc.to_json_with_layout()의 정보를 기반으로
     시각화에 필요한 필수 정보만 추출합니다.
-    
+
+    요소들은 객체 리스트가 아니라 병렬 배열(LayoutElementSoA)에 담겨
+    반환됩니다 — 순회/인덱싱하면 기존처럼 LayoutElement를 얻지만,
+    좌표는 연속 배열이라 페이지 필터와 좌표 변환을 벡터화할 수 있습니다.
+
     Args:
         doc: 파싱된 HWPX 문서
-    
+
     Returns:
-        tuple: (레이아웃 요소 리스트, 페이지 정보 리스트)
-    
+        tuple: (레이아웃 요소 SoA 컨테이너, 페이지 정보 리스트)
+
     사용 예시:
         doc = parse_hwpx_folder("results/hwpx_sample")
         elements, pages = extract_layout_elements(doc)
-        
+
         for elem in elements:
             print(f"{elem.text[:20]}... at ({elem.x}, {elem.y})")
     """
-    elements = []
     pages = []
-    
+
+    # 1차 순회: 요소 수 상한을 집계해 배열을 한 번에 할당
+    # (바운딩 박스가 없는 문단은 제외되므로 정확히는 상한 — 뒤에서 truncate)
+    total = 0
+    for section in doc.sections:
+        for para in section.paragraphs:
+            if not para.full_text.strip() and not para.tables:
+                continue
+            total += 1
+            for table in para.tables:
+                total += 1 + len(table.cells)
+
+    soa = LayoutElementSoA.empty(total)
+    i = 0
+
     for section in doc.sections:
         # 페이지 정보 추출
         page_mm = section.page_props.to_mm()
         margin_mm = section.page_props.margin.to_mm()
-        
+
         page_info = PageInfo(
             page_num=section.index,
             width=page_mm["width_mm"],
@@ -1405,90 +2001,84 @@ def extract_layout_elements(doc: HwpxDocument) -> tuple[list[LayoutElement], lis
             margin_right=margin_mm["right_mm"],
         )
         pages.append(page_info)
-        
-        # 문단별 레이아웃 요소 추출
+
+        sec_idx = section.index
+
+        # 문단별 레이아웃 요소 추출 (배열 인덱스 대입으로 채움)
         for para in section.paragraphs:
             text = para.full_text
             if not text.strip() and not para.tables:
                 continue
-            
+
             # 바운딩 박스 계산
             bbox = para.get_bounding_box()
-            
+
             if bbox and text.strip():
-                elem = LayoutElement(
-                    element_type="text",
-                    text=text,
-                    x=bbox["x_mm"],
-                    y=bbox["y_mm"],
-                    width=bbox["width_mm"],
-                    height=bbox["height_mm"],
-                    page=section.index,
-                    section=section.index,
-                    para_id=para.id,
-                    style_id=para.style_id,
-                    metadata={
-                        "para_pr_id": para.para_pr_id,
-                        "line_count": len(para.line_segments),
-                    }
-                )
-                elements.append(elem)
-            
+                soa.element_type[i] = "text"
+                soa.text[i] = text
+                soa.x[i] = bbox["x_mm"]
+                soa.y[i] = bbox["y_mm"]
+                soa.width[i] = bbox["width_mm"]
+                soa.height[i] = bbox["height_mm"]
+                soa.page[i] = sec_idx
+                soa.section[i] = sec_idx
+                soa.para_id[i] = para.id
+                soa.style_id[i] = para.style_id
+                soa.metadata[i] = (para.para_pr_id, len(para.line_segments))
+                soa.display_text[i] = _display_text(text)
+                i += 1
+
             # 테이블 요소 추출
             for table in para.tables:
-                table_size = table.size.to_mm()
+                tw_mm, th_mm = _size_mm_pair(table.size.width, table.size.height)
                 table_pos = table.position.to_mm()
-                
+                tx = table_pos["horz_offset_mm"]
+                ty = table_pos["vert_offset_mm"]
+
                 # 테이블 자체
-                table_elem = LayoutElement(
-                    element_type="table",
-                    text=f"[Table {table.rows}×{table.cols}]",
-                    x=table_pos["horz_offset_mm"],
-                    y=table_pos["vert_offset_mm"],
-                    width=table_size["width_mm"],
-                    height=table_size["height_mm"],
-                    page=section.index,
-                    section=section.index,
-                    metadata={
-                        "rows": table.rows,
-                        "cols": table.cols,
-                        "id": table.id,
-                        "z_order": table.z_order,
-                    }
-                )
-                elements.append(table_elem)
-                
+                soa.element_type[i] = "table"
+                label = f"[Table {table.rows}×{table.cols}]"
+                soa.text[i] = label
+                soa.x[i] = tx
+                soa.y[i] = ty
+                soa.width[i] = tw_mm
+                soa.height[i] = th_mm
+                soa.page[i] = sec_idx
+                soa.section[i] = sec_idx
+                soa.metadata[i] = (table.rows, table.cols, table.id, table.z_order)
+                soa.display_text[i] = label
+                i += 1
+
                 # 테이블 셀들
                 for cell in table.cells:
-                    cell_size = cell.size.to_mm()
-                    cell_elem = LayoutElement(
-                        element_type="table_cell",
-                        text=cell.text,
-                        x=table_pos["horz_offset_mm"],  # 셀별 정확한 위치 계산 필요
-                        y=table_pos["vert_offset_mm"],
-                        width=cell_size["width_mm"],
-                        height=cell_size["height_mm"],
-                        page=section.index,
-                        section=section.index,
-                        metadata={
-                            "row": cell.row,
-                            "col": cell.col,
-                            "row_span": cell.row_span,
-                            "col_span": cell.col_span,
-                        }
-                    )
-                    elements.append(cell_elem)
-    
-    return elements, pages
+                    cw_mm, ch_mm = _size_mm_pair(cell.size.width, cell.size.height)
+                    soa.element_type[i] = "table_cell"
+                    soa.text[i] = cell.text
+                    soa.x[i] = tx  # 셀별 정확한 위치 계산 필요
+                    soa.y[i] = ty
+                    soa.width[i] = cw_mm
+                    soa.height[i] = ch_mm
+                    soa.page[i] = sec_idx
+                    soa.section[i] = sec_idx
+                    soa.metadata[i] = (cell.row, cell.col, cell.row_span, cell.col_span)
+                    soa.display_text[i] = _display_text(cell.text)
+                    i += 1
+
+    soa.truncate(i)
+    return soa, pages
 
 
 def extract_layout_summary(doc: HwpxDocument) -> dict:
     """
     문서의 레이아웃 정보를 요약된 딕셔너리로 반환합니다.
-    
+
+    elements는 요소별 딕셔너리 리스트가 아니라 필드별 리스트를 담은
+    컬럼형(columnar) 구조입니다 — 대형 문서에서 중간 객체 그래프와
+    JSON 파일 크기를 함께 줄입니다.
+
     Args:
         doc: 파싱된 HWPX 문서
-    
+
     Returns:
         dict: 레이아웃 요약 정보
     """
@@ -1511,10 +2101,44 @@ def extract_layout_summary(doc: HwpxDocument) -> dict:
             }
             for p in pages
         ],
-        "elements": [e.to_dict() for e in elements],
+        "elements": elements.to_columns(),
     }
 
 
+def _build_rects(x, y, w, h, margin_left, margin_top, scale):
+    """요소 좌표를 (x1, y1, x2, y2) 모서리 배열로 변환하는 커널
+
+    여백 오프셋과 배율을 한 번에 적용합니다. SoA 덕분에 입력이 연속된
+    float32 배열이므로 순수 numpy 벡터 연산으로 처리되고, numba가
+    설치되어 있으면 아래에서 prange 병렬 JIT 버전으로 교체됩니다.
+    """
+    x1 = (x + margin_left) * scale
+    y1 = (y + margin_top) * scale
+    return x1, y1, x1 + w * scale, y1 + h * scale
+
+
+try:
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _build_rects(x, y, w, h, margin_left, margin_top, scale):  # noqa: F811
+        n = x.shape[0]
+        x1 = np.empty(n, np.float32)
+        y1 = np.empty(n, np.float32)
+        x2 = np.empty(n, np.float32)
+        y2 = np.empty(n, np.float32)
+        for i in prange(n):
+            fx = (x[i] + margin_left) * scale
+            fy = (y[i] + margin_top) * scale
+            x1[i] = fx
+            y1[i] = fy
+            x2[i] = fx + w[i] * scale
+            y2[i] = fy + h[i] * scale
+        return x1, y1, x2, y2
+except ImportError:
+    pass
+
+
 def visualize_document(
     doc: HwpxDocument,
     output_path: str | Path | None = None,
@@ -1524,6 +2148,7 @@ def visualize_document(
     font_size: int = 8,
     figsize: tuple[float, float] | None = None,
     dpi: int = 100,
+    fig: Any = None,
 ) -> Any:
     """
     문서를 화이트보드에 시각화합니다.
@@ -1539,7 +2164,8 @@ def visualize_document(
         font_size: 텍스트 폰트 크기
         figsize: 그림 크기 (인치 단위, None이면 자동)
         dpi: 해상도
-    
+        fig: 재사용할 matplotlib Figure (None이면 새로 생성)
+
     Returns:
         matplotlib Figure 객체
     
@@ -1555,51 +2181,138 @@ def visualize_document(
         # 파일로 저장
         visualize_document(doc, "output.png")
     """
+    # 레이아웃 요소 추출 (페이지 단위 반복 호출은 _visualize_page를 쓰면
+    # 이 추출을 문서당 한 번으로 줄일 수 있음 — create_document_viewer 참고)
+    elements, pages = extract_layout_elements(doc)
+    return _visualize_page(
+        elements, pages, doc.title,
+        output_path=output_path,
+        page_num=page_num,
+        show_bbox=show_bbox,
+        show_text=show_text,
+        font_size=font_size,
+        figsize=figsize,
+        dpi=dpi,
+        fig=fig,
+    )
+
+
+def _visualize_page(
+    elements: LayoutElementSoA,
+    pages: list[PageInfo],
+    title: str,
+    *,
+    output_path: str | Path | None = None,
+    page_num: int = 0,
+    show_bbox: bool = True,
+    show_text: bool = True,
+    font_size: int = 8,
+    figsize: tuple[float, float] | None = None,
+    dpi: int = 100,
+    fig: Any = None,
+) -> Any:
+    """추출이 끝난 요소/페이지 데이터로 한 페이지를 그리는 내부 헬퍼
+
+    extract_layout_elements는 섹션→문단→테이블→셀 전체를 순회하므로,
+    여러 페이지를 내보낼 때는 호출부에서 한 번만 추출해 이 함수에
+    넘기는 편이 페이지 수에 비례하는 중복 순회를 없앱니다.
+
+    fig를 넘기면 새 Figure를 만들지 않고 기존 것을 비워서 재사용합니다
+    — 페이지마다 반복되는 백엔드 초기화(렌더러/폰트 설정)를 생략.
+    """
     try:
         import matplotlib.pyplot as plt
         import matplotlib.patches as patches
-        from matplotlib import font_manager
     except ImportError:
         raise ImportError(
             "matplotlib 라이브러리가 필요합니다.\n"
             "설치: pip install matplotlib"
         )
-    
-    # 레이아웃 요소 추출
-    elements, pages = extract_layout_elements(doc)
-    
+
     if page_num >= len(pages):
         raise ValueError(f"페이지 {page_num}이 존재하지 않습니다. (총 {len(pages)} 페이지)")
     
     page = pages[page_num]
-    page_elements = [e for e in elements if e.page == page_num]
-    
+
+    # 여백 오프셋은 요소 좌표에 더하지 않고 축 범위를 이동시켜 처리
+    # (페이지 상수의 부분 평가 — 요소 배열은 원본 좌표 그대로 사용)
+    ox = page.margin_left
+    oy = page.margin_top
+
+    idx = elements.page_indices(page_num)
+    if np is not None:
+        ws = elements.width[idx]
+        hs = elements.height[idx]
+        xs, ys, xe, ye = _build_rects(
+            elements.x[idx], elements.y[idx], ws, hs, 0.0, 0.0, 1.0,
+        )
+        # 크기가 0이거나 페이지 밖에 있는 요소는 그리기 전에 잘라냄
+        # (잘못된 바운딩 박스가 많은 문서에서 헛된 draw 호출 제거)
+        visible = (
+            (ws > 0.1) & (hs > 0.1)
+            & (xs < page.width - ox) & (ys < page.height - oy)
+            & (xe > -ox) & (ye > -oy)
+        )
+        if not visible.all():
+            idx = idx[visible]
+            xs = xs[visible]
+            ys = ys[visible]
+            xe = xe[visible]
+            ye = ye[visible]
+            ws = ws[visible]
+            hs = hs[visible]
+    else:
+        xs, ys, ws, hs, kept = [], [], [], [], []
+        for i in idx:
+            x = elements.x[i]
+            y = elements.y[i]
+            w = elements.width[i]
+            h = elements.height[i]
+            if (w > 0.1 and h > 0.1 and x < page.width - ox
+                    and y < page.height - oy and x + w > -ox and y + h > -oy):
+                kept.append(i)
+                xs.append(x)
+                ys.append(y)
+                ws.append(w)
+                hs.append(h)
+        idx = kept
+
     # 그림 크기 설정 (A4 비율 유지)
     if figsize is None:
         scale = 0.5  # mm to inch 변환 (축소)
         figsize = (page.width * scale / 25.4, page.height * scale / 25.4)
     
-    # Figure 생성
-    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
-    
-    # 배경 (화이트보드)
+    # Figure 생성 (재사용 Figure가 있으면 본문 축만 비움 —
+    # 슬라이더 등 부가 축이 있어도 첫 번째 축이 본문)
+    if fig is None:
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+    else:
+        fig.set_size_inches(figsize)
+        ax = fig.axes[0] if fig.axes else fig.add_subplot()
+        ax.clear()
+
+    # sans-serif 폰트 탐색은 모듈 수준에서 한 번만 (페이지마다 DB 검색 방지)
+    sans_font = _find_sans_font()
+
+    # 배경 (화이트보드) — 데이터 좌표계는 여백 원점 기준이므로
+    # 축 범위를 (-ox, -oy)만큼 이동시켜 페이지 전체가 보이게 함
     ax.set_facecolor('white')
-    ax.set_xlim(0, page.width)
-    ax.set_ylim(page.height, 0)  # Y축 반전 (위에서 아래로)
+    ax.set_xlim(-ox, page.width - ox)
+    ax.set_ylim(page.height - oy, -oy)  # Y축 반전 (위에서 아래로)
     ax.set_aspect('equal')
-    
+
     # 페이지 테두리
     page_rect = patches.Rectangle(
-        (0, 0), page.width, page.height,
+        (-ox, -oy), page.width, page.height,
         linewidth=2, edgecolor='black', facecolor='white'
     )
     ax.add_patch(page_rect)
-    
-    # 여백 영역 표시 (연한 회색)
+
+    # 여백 영역 표시 (연한 회색) — 여백 원점 기준이므로 (0, 0)에서 시작
     margin_rect = patches.Rectangle(
-        (page.margin_left, page.margin_top),
-        page.width - page.margin_left - page.margin_right,
-        page.height - page.margin_top - page.margin_bottom,
+        (0, 0),
+        page.width - ox - page.margin_right,
+        page.height - oy - page.margin_bottom,
         linewidth=1, edgecolor='lightgray', facecolor='none',
         linestyle='--'
     )
@@ -1612,35 +2325,83 @@ def visualize_document(
         "table_cell": {"edge": "orange", "face": "lightyellow", "alpha": 0.2},
     }
     
-    # 요소들 그리기
-    for elem in page_elements:
-        color = colors.get(elem.element_type, colors["text"])
-        
-        # 좌표 보정 (여백 기준)
-        x = page.margin_left + elem.x
-        y = page.margin_top + elem.y
-        
-        if show_bbox:
-            # 바운딩 박스
-            rect = patches.Rectangle(
-                (x, y), elem.width, elem.height,
-                linewidth=1,
-                edgecolor=color["edge"],
-                facecolor=color["face"],
-                alpha=color["alpha"]
-            )
-            ax.add_patch(rect)
-        
-        if show_text and elem.text.strip():
-            # 텍스트 표시 (너무 긴 텍스트는 잘라서 표시)
-            display_text = elem.text.strip()
-            if len(display_text) > 30:
-                display_text = display_text[:27] + "..."
-            
+    etypes = elements.element_type
+
+    if show_bbox:
+        # 바운딩 박스: 요소마다 add_patch를 부르는 대신 유형별로
+        # PolyCollection 하나에 몰아서 추가 — 백엔드가 N개의 사각형을
+        # 단일 벡터화 경로로 그리므로 셀이 많은 테이블에서 크게 빠름
+        from matplotlib.collections import PolyCollection
+
+        if np is not None:
+            et = np.array([etypes[i] for i in idx], dtype=object)
+            known = np.isin(et, list(colors))
+            for elem_type, style in colors.items():
+                m = et == elem_type
+                if elem_type == "text":
+                    m |= ~known  # 미지정 유형은 기존처럼 text 스타일로
+                if not m.any():
+                    continue
+                x = xs[m]
+                y = ys[m]
+                x2 = xe[m]
+                y2 = ye[m]
+                verts = np.stack(
+                    [
+                        np.stack([x, y], axis=1),
+                        np.stack([x2, y], axis=1),
+                        np.stack([x2, y2], axis=1),
+                        np.stack([x, y2], axis=1),
+                    ],
+                    axis=1,
+                )
+                ax.add_collection(PolyCollection(
+                    verts,
+                    facecolors=style["face"],
+                    edgecolors=style["edge"],
+                    linewidths=1,
+                    alpha=style["alpha"],
+                ))
+        else:
+            verts_by_type: dict[str, list] = {t: [] for t in colors}
+            for k, i in enumerate(idx):
+                elem_type = etypes[i] if etypes[i] in colors else "text"
+                x = xs[k]
+                y = ys[k]
+                x2 = x + ws[k]
+                y2 = y + hs[k]
+                verts_by_type[elem_type].append(
+                    [(x, y), (x2, y), (x2, y2), (x, y2)]
+                )
+            for elem_type, verts in verts_by_type.items():
+                if not verts:
+                    continue
+                style = colors[elem_type]
+                ax.add_collection(PolyCollection(
+                    verts,
+                    facecolors=style["face"],
+                    edgecolors=style["edge"],
+                    linewidths=1,
+                    alpha=style["alpha"],
+                ))
+
+    if show_text:
+        # 표시 문자열은 추출 시 선계산됨 (strip/말줄임 반복 제거)
+        disp = elements.display_text
+        # 화면에서 2픽셀이 안 되는 상자는 어차피 읽을 수 없으므로
+        # ax.text 호출 자체를 생략 (밀집 문서에서 대부분의 호출 제거)
+        min_mm = 2 * 25.4 / dpi
+        for k, i in enumerate(idx):
+            if hs[k] < min_mm or ws[k] < min_mm:
+                continue
+            display_text = disp[i]
+            if not display_text:
+                continue
+
             # 텍스트 위치 (박스 중앙 또는 왼쪽 상단)
-            text_x = x + 1  # 약간의 패딩
-            text_y = y + elem.height / 2
-            
+            text_x = xs[k] + 1  # 약간의 패딩
+            text_y = ys[k] + hs[k] / 2
+
             ax.text(
                 text_x, text_y,
                 display_text,
@@ -1649,12 +2410,12 @@ def visualize_document(
                 horizontalalignment='left',
                 color='black',
                 clip_on=True,
-                fontfamily='sans-serif',
+                fontproperties=sans_font,
             )
     
     # 제목
     ax.set_title(
-        f"{doc.title} - Page {page_num + 1}/{len(pages)}",
+        f"{title} - Page {page_num + 1}/{len(pages)}",
         fontsize=12,
         fontweight='bold'
     )
@@ -1665,17 +2426,140 @@ def visualize_document(
     
     # 그리드 (선택적)
     ax.grid(True, linestyle=':', alpha=0.3)
-    
-    plt.tight_layout()
-    
+
+    # 슬라이더 등 부가 축이 있으면 tight_layout이 배치를 망가뜨리므로 생략
+    if len(fig.axes) == 1:
+        fig.tight_layout()
+
     # 저장 또는 표시
     if output_path:
-        plt.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
+        # PNG는 Pillow 인코더에 낮은 압축 레벨을 지정 (미리보기 저장 속도 우선)
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white',
+                    pil_kwargs={"compress_level": 1})
         print(f"✅ 이미지 저장: {output_path}")
-    
+
     return fig
 
 
+_SANS_FONT = None
+
+
+def _find_sans_font():
+    """sans-serif에 해당하는 실제 폰트를 한 번만 탐색해 FontProperties로 캐시
+
+    findfont에 문자열을 주면 fontconfig 패턴으로 해석되어 하이픈에서
+    ValueError가 나므로 FontProperties 객체로 질의합니다.
+    """
+    global _SANS_FONT
+    if _SANS_FONT is None:
+        from matplotlib import font_manager
+
+        path = font_manager.findfont(font_manager.FontProperties(family=["sans-serif"]))
+        _SANS_FONT = font_manager.FontProperties(fname=path)
+    return _SANS_FONT
+
+
+# 페이지 렌더링 워커(프로세스)별로 재사용되는 Figure
+# — 페이지마다 subplots()/close()를 반복하지 않아 백엔드 초기화가 1회로 줄어듦
+_VIEWER_FIG = None
+
+
+def _render_page_to_file(args: tuple) -> Path:
+    """matplotlib 페이지 렌더링 헬퍼 (프로세스 풀에서 사용하므로 모듈 레벨에 정의)"""
+    global _VIEWER_FIG
+    elements, pages, title, output_path, page_num = args
+
+    _VIEWER_FIG = _visualize_page(
+        elements, pages, title,
+        output_path=output_path,
+        page_num=page_num,
+        show_bbox=True,
+        show_text=True,
+        fig=_VIEWER_FIG,
+    )
+    return output_path
+
+
+def _close_viewer_fig() -> None:
+    """재사용 Figure 정리 (순차 렌더링 후 메인 프로세스에서 호출)"""
+    global _VIEWER_FIG
+    if _VIEWER_FIG is not None:
+        import matplotlib.pyplot as plt
+
+        plt.close(_VIEWER_FIG)
+        _VIEWER_FIG = None
+
+
+# 시각화용 트루타입 폰트 후보 경로 (시스템별)
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+)
+_FONT_PATH: str | None | bool = False  # False = 아직 탐색 전
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size: int):
+    """(폰트 경로, 크기)별 ImageFont 캐시
+
+    TTF 파일을 열고 파싱하는 비용을 페이지마다 반복하지 않도록
+    경로 탐색은 프로세스당 한 번, 폰트 객체는 크기별로 한 번만 만듭니다.
+    """
+    global _FONT_PATH
+    from PIL import ImageFont
+
+    if _FONT_PATH is False:
+        _FONT_PATH = next(
+            (p for p in _FONT_CANDIDATES if Path(p).exists()), None
+        )
+    if _FONT_PATH is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(_FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+# PIL 경로에서 numpy 버퍼에 직접 그릴 때 쓰는 테두리 색 (outline 색상명과 동일)
+_OUTLINE_RGB = {
+    "text": (0, 0, 255),        # blue
+    "table": (0, 128, 0),       # green
+    "table_cell": (255, 165, 0),  # orange
+}
+
+
+def _draw_box_edges(arr, x1, y1, x2, y2, rgb, width: int = 1) -> None:
+    """numpy 이미지 버퍼에 사각형 테두리를 슬라이스 대입으로 그림
+
+    draw.rectangle 호출(요소당 파이썬→C 전환 1회)을 네 번의 슬라이스
+    대입으로 대체 — 슬라이스 본체는 C 레벨 memcpy라 오버헤드가 상수화됨.
+    """
+    h, w = arr.shape[:2]
+    x1 = max(int(x1), 0)
+    y1 = max(int(y1), 0)
+    x2 = min(int(x2), w - 1)
+    y2 = min(int(y2), h - 1)
+    if x2 <= x1 or y2 <= y1:
+        return
+    arr[y1:y1 + width, x1:x2 + 1] = rgb               # 위
+    arr[max(y2 - width + 1, 0):y2 + 1, x1:x2 + 1] = rgb  # 아래
+    arr[y1:y2 + 1, x1:x1 + width] = rgb               # 왼쪽
+    arr[y1:y2 + 1, max(x2 - width + 1, 0):x2 + 1] = rgb  # 오른쪽
+
+
+def _render_page_pil_to_file(args: tuple) -> Path:
+    """PIL 페이지 렌더링 헬퍼 (스레드 풀 공용)"""
+    elements, pages, title, output_path, page_num, scale = args
+    return _visualize_page_pil(
+        elements, pages, title,
+        output_path=output_path,
+        page_num=page_num,
+        show_bbox=True,
+        show_text=True,
+        scale=scale,
+    )
+
+
 def create_document_viewer(
     doc: HwpxDocument,
     output_dir: str | Path | None = None,
@@ -1695,7 +2579,7 @@ def create_document_viewer(
         images = create_document_viewer(doc, "output_images")
     """
     try:
-        import matplotlib.pyplot as plt
+        import matplotlib.pyplot  # 워커를 띄우기 전에 의존성 사전 확인
     except ImportError:
         raise ImportError(
             "matplotlib 라이브러리가 필요합니다.\n"
@@ -1709,28 +2593,36 @@ def create_document_viewer(
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    _, pages = extract_layout_elements(doc)
-    saved_files = []
-    
+    # 추출은 문서당 한 번 — 페이지 렌더링은 서로 독립이므로 병렬 처리
+    elements, pages = extract_layout_elements(doc)
+
     print(f"📄 {doc.title} 문서 시각화 중...")
-    
-    for page_num in range(len(pages)):
-        output_path = output_dir / f"{doc.title}_page_{page_num + 1:03d}.png"
-        
-        fig = visualize_document(
-            doc,
-            output_path=output_path,
-            page_num=page_num,
-            show_bbox=True,
-            show_text=True,
+
+    tasks = [
+        (
+            elements, pages, doc.title,
+            output_dir / f"{doc.title}_page_{page_num + 1:03d}.png",
+            page_num,
         )
-        plt.close(fig)  # 메모리 해제
-        
-        saved_files.append(output_path)
+        for page_num in range(len(pages))
+    ]
+
+    if len(tasks) > 1:
+        # PNG 인코딩(zlib)과 렌더링이 페이지 수만큼 코어에 분산됨
+        # (matplotlib은 스레드 안전하지 않으므로 프로세스 풀 사용)
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            saved_files = list(executor.map(_render_page_to_file, tasks))
+    else:
+        saved_files = [_render_page_to_file(task) for task in tasks]
+        _close_viewer_fig()
+
+    for page_num, output_path in enumerate(saved_files):
         print(f"  ✅ Page {page_num + 1}: {output_path}")
-    
+
     print(f"\n📁 총 {len(saved_files)}개 이미지 생성 완료")
-    
+
     return saved_files
 
 
@@ -1762,9 +2654,9 @@ def visualize_document_interactive(doc: HwpxDocument):
         print("표시할 페이지가 없습니다.")
         return
     
-    # 초기 페이지 표시
-    fig = visualize_document(doc, page_num=0)
-    
+    # 초기 페이지 표시 (추출 결과 재사용)
+    fig = _visualize_page(elements, pages, doc.title, page_num=0)
+
     # 슬라이더 추가 (여러 페이지인 경우)
     if len(pages) > 1:
         plt.subplots_adjust(bottom=0.15)
@@ -1775,13 +2667,17 @@ def visualize_document_interactive(doc: HwpxDocument):
             valinit=1,
             valstep=1
         )
-        
+
         def update(val):
+            # 클로저에 잡힌 elements/pages와 기존 Figure를 그대로 재사용 —
+            # 추출/백엔드 초기화 없이 본문 축의 아티스트만 해당 페이지의
+            # SoA 배열로 다시 구성하고 draw_idle로 비동기 갱신
             page_num = int(val) - 1
-            plt.clf()
-            visualize_document(doc, page_num=page_num)
-            plt.draw()
-        
+            _visualize_page(
+                elements, pages, doc.title, page_num=page_num, fig=fig
+            )
+            fig.canvas.draw_idle()
+
         slider.on_changed(update)
     
     plt.show()
@@ -1795,12 +2691,13 @@ def visualize_document_pil(
     show_text: bool = True,
     scale: float = 3.0,
     font_size: int = 12,
+    fast: bool = True,
 ) -> Path:
     """
     PIL을 사용하여 문서를 시각화합니다 (matplotlib 대안).
-    
+
     matplotlib이 작동하지 않을 때 사용할 수 있는 대안입니다.
-    
+
     Args:
         doc: 파싱된 HWPX 문서
         output_path: 이미지 저장 경로
@@ -1809,100 +2706,180 @@ def visualize_document_pil(
         show_text: 텍스트 표시 여부
         scale: 확대 비율 (1mm = scale 픽셀)
         font_size: 폰트 크기
-    
+        fast: True면 PNG를 낮은 압축으로 저장 (파일은 다소 커지나 수 배 빠름)
+
     Returns:
         Path: 저장된 이미지 경로
     
     필요한 라이브러리:
         pip install Pillow
     """
+    # 레이아웃 요소 추출 (여러 페이지를 내보낼 때는 _visualize_page_pil에
+    # 추출 결과를 직접 넘겨 중복 순회를 피할 것)
+    elements, pages = extract_layout_elements(doc)
+    return _visualize_page_pil(
+        elements, pages, doc.title,
+        output_path=output_path,
+        page_num=page_num,
+        show_bbox=show_bbox,
+        show_text=show_text,
+        scale=scale,
+        font_size=font_size,
+        fast=fast,
+    )
+
+
+def _visualize_page_pil(
+    elements: LayoutElementSoA,
+    pages: list[PageInfo],
+    title: str,
+    *,
+    output_path: str | Path,
+    page_num: int = 0,
+    show_bbox: bool = True,
+    show_text: bool = True,
+    scale: float = 3.0,
+    font_size: int = 12,
+    fast: bool = True,
+) -> Path:
+    """추출이 끝난 요소/페이지 데이터로 한 페이지를 PIL로 그리는 내부 헬퍼"""
     try:
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import Image, ImageDraw
     except ImportError:
         raise ImportError(
             "Pillow 라이브러리가 필요합니다.\n"
             "설치: pip install Pillow"
         )
-    
-    # 레이아웃 요소 추출
-    elements, pages = extract_layout_elements(doc)
-    
+
     if page_num >= len(pages):
         raise ValueError(f"페이지 {page_num}이 존재하지 않습니다.")
     
     page = pages[page_num]
-    page_elements = [e for e in elements if e.page == page_num]
-    
+
+    # 페이지 필터 + 픽셀 좌표 변환을 배열 연산으로 선계산
+    # (요소당 네 번의 float 곱/덧셈 + int() 호출을 벡터 연산으로 대체)
+    idx = elements.page_indices(page_num)
+    if np is not None:
+        fx1, fy1, fx2, fy2 = _build_rects(
+            elements.x[idx], elements.y[idx],
+            elements.width[idx], elements.height[idx],
+            page.margin_left, page.margin_top, scale,
+        )
+        # 크기가 0이거나 페이지 밖 요소는 그리기 전에 잘라냄 (픽셀 기준)
+        min_px = 0.1 * scale
+        visible = (
+            (fx2 - fx1 > min_px) & (fy2 - fy1 > min_px)
+            & (fx1 < page.width * scale) & (fy1 < page.height * scale)
+            & (fx2 > 0) & (fy2 > 0)
+        )
+        if not visible.all():
+            idx = idx[visible]
+            fx1 = fx1[visible]
+            fy1 = fy1[visible]
+            fx2 = fx2[visible]
+            fy2 = fy2[visible]
+        x1s = fx1.astype(np.int32)
+        y1s = fy1.astype(np.int32)
+        x2s = fx2.astype(np.int32)
+        y2s = fy2.astype(np.int32)
+    else:
+        x1s, y1s, x2s, y2s, kept = [], [], [], [], []
+        for i in idx:
+            x1 = (page.margin_left + elements.x[i]) * scale
+            y1 = (page.margin_top + elements.y[i]) * scale
+            x2 = x1 + elements.width[i] * scale
+            y2 = y1 + elements.height[i] * scale
+            if (x2 - x1 > 0.1 * scale and y2 - y1 > 0.1 * scale
+                    and x1 < page.width * scale and y1 < page.height * scale
+                    and x2 > 0 and y2 > 0):
+                kept.append(i)
+                x1s.append(int(x1))
+                y1s.append(int(y1))
+                x2s.append(int(x2))
+                y2s.append(int(y2))
+        idx = kept
+
     # 이미지 크기 계산
     img_width = int(page.width * scale)
     img_height = int(page.height * scale)
     
-    # 이미지 생성 (흰색 배경)
-    img = Image.new('RGB', (img_width, img_height), 'white')
-    draw = ImageDraw.Draw(img)
-    
-    # 기본 폰트 (시스템 폰트 사용 시도)
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
-    
-    # 페이지 테두리
-    draw.rectangle(
-        [(0, 0), (img_width - 1, img_height - 1)],
-        outline='black',
-        width=2
-    )
-    
-    # 여백 영역 표시
+    # 여백 영역 좌표
     margin_left = int(page.margin_left * scale)
     margin_top = int(page.margin_top * scale)
     margin_right = int((page.width - page.margin_right) * scale)
     margin_bottom = int((page.height - page.margin_bottom) * scale)
-    draw.rectangle(
-        [(margin_left, margin_top), (margin_right, margin_bottom)],
-        outline='lightgray',
-        width=1
-    )
-    
-    # 색상 정의
-    colors = {
-        "text": {"outline": "blue", "fill": (173, 216, 230, 100)},
-        "table": {"outline": "green", "fill": (144, 238, 144, 100)},
-        "table_cell": {"outline": "orange", "fill": (255, 255, 224, 100)},
-    }
-    
-    # 요소들 그리기
-    for elem in page_elements:
-        color = colors.get(elem.element_type, colors["text"])
-        
-        # 좌표 변환
-        x1 = int((page.margin_left + elem.x) * scale)
-        y1 = int((page.margin_top + elem.y) * scale)
-        x2 = int((page.margin_left + elem.x + elem.width) * scale)
-        y2 = int((page.margin_top + elem.y + elem.height) * scale)
-        
+
+    etypes = elements.element_type
+
+    if np is not None:
+        # numpy 버퍼에 테두리/바운딩 박스를 슬라이스 대입으로 그린 뒤
+        # 한 번에 이미지로 변환 — draw.rectangle 호출을 모두 제거
+        arr = np.full((img_height, img_width, 3), 255, np.uint8)
+
+        # 페이지 테두리
+        _draw_box_edges(arr, 0, 0, img_width - 1, img_height - 1, (0, 0, 0), width=2)
+
+        # 여백 영역 표시
+        _draw_box_edges(arr, margin_left, margin_top, margin_right, margin_bottom,
+                        (211, 211, 211), width=1)
+
         if show_bbox:
-            # 바운딩 박스
-            draw.rectangle(
-                [(x1, y1), (x2, y2)],
-                outline=color["outline"],
-                width=1
-            )
-        
-        if show_text and elem.text.strip():
-            # 텍스트 표시
-            display_text = elem.text.strip()
-            if len(display_text) > 25:
-                display_text = display_text[:22] + "..."
-            
+            for k, i in enumerate(idx):
+                rgb = _OUTLINE_RGB.get(etypes[i], _OUTLINE_RGB["text"])
+                _draw_box_edges(arr, x1s[k], y1s[k], x2s[k], y2s[k], rgb, width=1)
+
+        img = Image.fromarray(arr)
+        draw = ImageDraw.Draw(img)
+    else:
+        # 이미지 생성 (흰색 배경)
+        img = Image.new('RGB', (img_width, img_height), 'white')
+        draw = ImageDraw.Draw(img)
+
+        # 페이지 테두리
+        draw.rectangle(
+            [(0, 0), (img_width - 1, img_height - 1)],
+            outline='black',
+            width=2
+        )
+
+        # 여백 영역 표시
+        draw.rectangle(
+            [(margin_left, margin_top), (margin_right, margin_bottom)],
+            outline='lightgray',
+            width=1
+        )
+
+        # 색상 정의
+        colors = {
+            "text": {"outline": "blue"},
+            "table": {"outline": "green"},
+            "table_cell": {"outline": "orange"},
+        }
+
+        if show_bbox:
+            for k, i in enumerate(idx):
+                color = colors.get(etypes[i], colors["text"])
+                draw.rectangle(
+                    [(x1s[k], y1s[k]), (x2s[k], y2s[k])],
+                    outline=color["outline"],
+                    width=1
+                )
+
+    # 기본 폰트 (경로 탐색/파싱 결과는 모듈 수준 캐시)
+    font = _get_font(font_size)
+
+    # 텍스트 그리기 (표시 문자열은 추출 시 선계산, 좌표는 정수 배열에서 읽음)
+    if show_text:
+        disp = elements.display_text
+        for k, i in enumerate(idx):
+            display_text = disp[i]
+            if not display_text:
+                continue
+
             # 텍스트가 박스 안에 들어가도록
             try:
                 draw.text(
-                    (x1 + 2, y1 + 2),
+                    (x1s[k] + 2, y1s[k] + 2),
                     display_text,
                     fill='black',
                     font=font
@@ -1911,12 +2888,16 @@ def visualize_document_pil(
                 pass  # 폰트 문제 시 무시
     
     # 제목 추가
-    title = f"{doc.title} - Page {page_num + 1}/{len(pages)}"
-    draw.text((10, 10), title, fill='black', font=font)
+    page_title = f"{title} - Page {page_num + 1}/{len(pages)}"
+    draw.text((10, 10), page_title, fill='black', font=font)
     
-    # 저장
+    # 저장 — 미리보기 용도의 PNG는 압축 시간이 지배적이므로 기본은
+    # 낮은 압축 레벨 (파일 ~1.3배, 저장은 수 배 빠름)
     output_path = Path(output_path)
-    img.save(output_path)
+    if fast:
+        img.save(output_path, compress_level=1, optimize=False)
+    else:
+        img.save(output_path)
     print(f"✅ 이미지 저장: {output_path}")
     
     return output_path
@@ -1945,27 +2926,31 @@ def create_document_viewer_pil(
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    _, pages = extract_layout_elements(doc)
-    saved_files = []
-    
+    # 추출은 문서당 한 번 — 페이지 렌더링은 병렬 처리
+    elements, pages = extract_layout_elements(doc)
+
     print(f"📄 {doc.title} 문서 시각화 중 (PIL)...")
-    
-    for page_num in range(len(pages)):
-        output_path = output_dir / f"{doc.title}_page_{page_num + 1:03d}.png"
-        
-        visualize_document_pil(
-            doc,
-            output_path=output_path,
-            page_num=page_num,
-            show_bbox=True,
-            show_text=True,
-            scale=scale,
+
+    tasks = [
+        (
+            elements, pages, doc.title,
+            output_dir / f"{doc.title}_page_{page_num + 1:03d}.png",
+            page_num, scale,
         )
-        
-        saved_files.append(output_path)
-    
+        for page_num in range(len(pages))
+    ]
+
+    if len(tasks) > 1:
+        # PIL의 PNG 저장은 libpng 압축 중 GIL을 풀므로 스레드 풀로 충분
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as executor:
+            saved_files = list(executor.map(_render_page_pil_to_file, tasks))
+    else:
+        saved_files = [_render_page_pil_to_file(task) for task in tasks]
+
     print(f"\n📁 총 {len(saved_files)}개 이미지 생성 완료")
-    
+
     return saved_files
 
 
